@@ -0,0 +1,42 @@
+"""add_findings_keyset_pagination_indexes
+
+Revision ID: 3c1e9d4b7f20
+Revises: 7a80fdf31643
+Create Date: 2026-10-15 09:12:41.208553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1e9d4b7f20'
+down_revision: Union[str, Sequence[str], None] = '7a80fdf31643'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite (sort column, id) indexes for keyset pagination.
+    
+    The findings list seeks with a row-value comparison on
+    (sort_column, id), so each sortable column needs an index that
+    ends in id for the planner to walk it in order.
+    """
+    op.create_index('idx_findings_created_at_id', 'findings', ['created_at', 'id'])
+    op.create_index('idx_findings_severity_id', 'findings', ['severity', 'id'])
+    op.create_index('idx_findings_secret_type_id', 'findings', ['secret_type', 'id'])
+    op.create_index('idx_findings_file_path_id', 'findings', ['file_path', 'id'])
+
+
+def downgrade() -> None:
+    """
+    Remove keyset pagination indexes.
+    """
+    op.drop_index('idx_findings_file_path_id', table_name='findings')
+    op.drop_index('idx_findings_secret_type_id', table_name='findings')
+    op.drop_index('idx_findings_severity_id', table_name='findings')
+    op.drop_index('idx_findings_created_at_id', table_name='findings')
@@ -0,0 +1,52 @@
+"""add_findings_active_partial_indexes
+
+Revision ID: 5e8a2f6c0d13
+Revises: 3c1e9d4b7f20
+Create Date: 2026-10-15 10:03:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a2f6c0d13'
+down_revision: Union[str, Sequence[str], None] = '3c1e9d4b7f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add partial indexes restricted to active (not soft-deleted) findings.
+    
+    Every findings query filters on deleted_at IS NULL, so indexes that
+    share that predicate skip soft-deleted rows entirely and stay smaller
+    than their full-table counterparts.
+    
+    Changes:
+    - Active findings ordered by creation time (default list sort)
+    - Active findings by repository, status and severity (common filters)
+    """
+    op.create_index(
+        'idx_findings_active_created',
+        'findings',
+        ['created_at'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'idx_findings_active_repo_status_severity',
+        'findings',
+        ['repository_id', 'status', 'severity'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Remove active findings partial indexes.
+    """
+    op.drop_index('idx_findings_active_repo_status_severity', table_name='findings')
+    op.drop_index('idx_findings_active_created', table_name='findings')
@@ -0,0 +1,55 @@
+"""add_findings_related_lookup_indexes
+
+Revision ID: 9b4d7e1a2c56
+Revises: 5e8a2f6c0d13
+Create Date: 2026-10-15 11:26:05.731184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d7e1a2c56'
+down_revision: Union[str, Sequence[str], None] = '5e8a2f6c0d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add indexes backing the related-findings lookup.
+    
+    Changes:
+    - Enable pg_trgm and add a trigram GIN index on file_path so the
+      directory LIKE 'dir/%' filter can be answered from an index
+    - Add a partial (repository_id, secret_type, created_at DESC) index
+      over active findings for the remaining predicates and ordering
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    op.create_index(
+        'idx_findings_file_path_trgm',
+        'findings',
+        ['file_path'],
+        postgresql_using='gin',
+        postgresql_ops={'file_path': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_findings_repo_type_created',
+        'findings',
+        ['repository_id', 'secret_type', sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Remove related-findings indexes.
+    
+    The pg_trgm extension is left installed since other objects may use it.
+    """
+    op.drop_index('idx_findings_repo_type_created', table_name='findings')
+    op.drop_index('idx_findings_file_path_trgm', table_name='findings')
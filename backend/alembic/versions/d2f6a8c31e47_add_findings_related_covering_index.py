@@ -0,0 +1,51 @@
+"""add_findings_related_covering_index
+
+Revision ID: d2f6a8c31e47
+Revises: 9b4d7e1a2c56
+Create Date: 2026-10-15 14:02:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a8c31e47'
+down_revision: Union[str, Sequence[str], None] = '9b4d7e1a2c56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Make the related-findings index covering.
+    
+    Changes:
+    - Replace idx_findings_repo_type_created with a partial
+      (repository_id, secret_type, created_at DESC) index over active
+      findings that INCLUDEs id, file_path, severity and status, so the
+      related-findings filters and count can be answered index-only
+    """
+    op.drop_index('idx_findings_repo_type_created', table_name='findings')
+    op.create_index(
+        'idx_findings_related_covering',
+        'findings',
+        ['repository_id', 'secret_type', sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        postgresql_include=['id', 'file_path', 'severity', 'status'],
+    )
+
+
+def downgrade() -> None:
+    """
+    Restore the non-covering related-findings index.
+    """
+    op.drop_index('idx_findings_related_covering', table_name='findings')
+    op.create_index(
+        'idx_findings_repo_type_created',
+        'findings',
+        ['repository_id', 'secret_type', sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
@@ -0,0 +1,156 @@
+"""
+Redis cache connection and JSON helpers.
+
+This module provides:
+- Async Redis client initialization and cleanup
+- Best-effort JSON get/set/invalidate helpers for response caching
+
+Caching is an optimization only: if Redis is not initialized or a
+command fails, helpers behave like a cache miss and the caller falls
+back to computing the value.
+"""
+
+import os
+import re
+from fnmatch import fnmatchcase
+from typing import Any
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Global Redis client
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis | None:
+    """
+    Get the Redis client.
+
+    Returns:
+        Redis | None: The client, or None if caching is not initialized.
+    """
+    return _redis
+
+
+async def init_cache() -> None:
+    """
+    Initialize the Redis client.
+
+    This should be called during application startup.
+    """
+    global _redis
+
+    logger.info(
+        "Initializing Redis connection",
+        extra={"redis_url": settings.REDIS_URL.split("@")[-1]},
+    )
+
+    # Bounded timeouts keep a hung Redis from stalling requests: a command
+    # that times out is treated like any other cache failure
+    client = Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_TIMEOUT,
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        raise
+    _redis = client
+
+    logger.info("Redis connection initialized successfully")
+
+
+async def close_cache() -> None:
+    """
+    Close the Redis client.
+
+    This should be called during application shutdown.
+    """
+    global _redis
+
+    if _redis is not None:
+        logger.info("Closing Redis connection")
+        await _redis.aclose()
+        _redis = None
+        logger.info("Redis connection closed")
+
+
+async def cache_get_json(key: str) -> Any | None:
+    """
+    Read a JSON value from the cache.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        The decoded value, or None on a miss or if Redis is unavailable.
+    """
+    if _redis is None:
+        return None
+
+    try:
+        raw = await _redis.get(key)
+    except RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int) -> None:
+    """
+    Store a JSON-serializable value in the cache.
+
+    Args:
+        key: Cache key
+        value: Value to store (serialized with orjson)
+        ttl: Time to live in seconds
+    """
+    if _redis is None:
+        return
+
+    try:
+        await _redis.set(key, orjson.dumps(value), ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_invalidate(*patterns: str) -> None:
+    """
+    Delete every cached key matching the given glob patterns.
+
+    The keyspace is scanned once however many patterns are given: the
+    SCAN is narrowed to the patterns' shared literal prefix and keys are
+    matched against each pattern locally.
+
+    Args:
+        patterns: Redis glob patterns using * and ? (e.g. "stats:all:*")
+    """
+    if _redis is None or not patterns:
+        return
+
+    if len(patterns) == 1:
+        match = patterns[0]
+    else:
+        prefix = re.split(r"[*?\[\\]", os.path.commonprefix(patterns), maxsplit=1)[0]
+        match = prefix + "*"
+    encoded = [pattern.encode() for pattern in patterns]
+
+    try:
+        keys = [
+            key
+            async for key in _redis.scan_iter(match=match)
+            if len(encoded) == 1 or any(fnmatchcase(key, pattern) for pattern in encoded)
+        ]
+        if keys:
+            await _redis.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {patterns}: {e}")
@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "postgres"
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "gitzen"
+    # Pooled connections a single statistics request may hold at once
+    STATISTICS_MAX_CONCURRENT_QUERIES: int = 2
     
     @property
     def DATABASE_URL(self) -> str:
@@ -62,6 +64,7 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
+    REDIS_TIMEOUT: int = 5  # seconds, for both connecting and commands
     
     @property
     def REDIS_URL(self) -> str:
@@ -86,6 +89,10 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     
+    # Response Caching
+    STATISTICS_CACHE_TTL_SECONDS: int = 60
+    GITHUB_CACHE_TTL_SECONDS: int = 60
+    
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 100
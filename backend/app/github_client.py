@@ -0,0 +1,86 @@
+"""
+Shared GitHub HTTP client.
+
+This module provides:
+- A single pooled httpx client for GitHub API and OAuth requests
+- Client initialization and cleanup
+
+The client is shared across requests, so it carries no credentials:
+callers pass the user's token per request via the Authorization header,
+and cookies set by GitHub are never stored (they would otherwise be sent
+on other users' requests).
+Keep-alive connections and HTTP/2 multiplexing avoid a TCP/TLS handshake
+per GitHub call.
+"""
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Global GitHub client
+_client: httpx.AsyncClient | None = None
+
+
+def get_github_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared GitHub client.
+
+    Returns:
+        httpx.AsyncClient: The pooled client (base URL is the GitHub API).
+
+    Raises:
+        RuntimeError: If the client is not initialized.
+    """
+    if _client is None:
+        raise RuntimeError(
+            "GitHub client not initialized. Call init_github_client() first."
+        )
+    return _client
+
+
+async def init_github_client() -> None:
+    """
+    Initialize the shared GitHub client.
+
+    This should be called during application startup.
+    """
+    global _client
+
+    logger.info("Initializing GitHub HTTP client")
+
+    _client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=1000,
+            max_keepalive_connections=100,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        headers={"Accept": "application/vnd.github+json"},
+        # An empty allowed-domains list rejects every cookie
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+
+    logger.info("GitHub HTTP client initialized successfully")
+
+
+async def close_github_client() -> None:
+    """
+    Close the shared GitHub client.
+
+    This should be called during application shutdown.
+    """
+    global _client
+
+    if _client is not None:
+        logger.info("Closing GitHub HTTP client")
+        await _client.aclose()
+        _client = None
+        logger.info("GitHub HTTP client closed")
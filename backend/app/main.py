@@ -8,12 +8,14 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import time
 from app.config import settings
 from app.logging_config import get_logger
 from app.database import init_db, close_db, check_db_health
+from app.cache import init_cache, close_cache
+from app.github_client import init_github_client, close_github_client
 from app.middleware import (
     PrivacyMiddleware,
     RequestLoggingMiddleware,
@@ -38,6 +40,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 # Exception Handlers
@@ -165,6 +168,7 @@ async def startup_event():
     - Log startup information
     - Initialize database connection pool
     - Initialize Redis connection
+    - Initialize shared GitHub HTTP client
     - Run any necessary migrations
     """
     logger.info("🚀 Gitzen API starting up...")
@@ -182,7 +186,22 @@ async def startup_event():
         # Don't fail startup - allow app to start in degraded mode
         logger.warning("⚠️ Starting in degraded mode without database")
     
-    # TODO: Initialize Redis connection (GITZ-34)
+    # Initialize Redis connection (response cache)
+    try:
+        await init_cache()
+        logger.info("✅ Redis connection initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize Redis: {e}")
+        # Caching is optional - serve uncached responses instead
+        logger.warning("⚠️ Starting without response cache")
+    
+    # Initialize shared GitHub HTTP client (connection pool)
+    try:
+        await init_github_client()
+        logger.info("✅ GitHub HTTP client initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize GitHub HTTP client: {e}")
+    
     # TODO: Run health checks on dependencies
     
     logger.info("✅ Ready to accept requests")
@@ -195,6 +214,7 @@ async def shutdown_event():
     
     - Close database connections
     - Close Redis connections
+    - Close GitHub HTTP client
     - Clean up resources
     """
     logger.info("🛑 Gitzen API shutting down...")
@@ -206,7 +226,20 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"⚠️ Error closing database: {e}")
     
-    # TODO: Close Redis connection
+    # Close Redis connection
+    try:
+        await close_cache()
+        logger.info("✅ Redis connection closed")
+    except Exception as e:
+        logger.error(f"⚠️ Error closing Redis: {e}")
+    
+    # Close GitHub HTTP client
+    try:
+        await close_github_client()
+        logger.info("✅ GitHub HTTP client closed")
+    except Exception as e:
+        logger.error(f"⚠️ Error closing GitHub HTTP client: {e}")
+    
     # TODO: Clean up any remaining resources
     
     logger.info("✅ Cleanup complete")
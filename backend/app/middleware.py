@@ -8,13 +8,15 @@ It intercepts all responses and automatically redacts any sensitive
 data that might have slipped through.
 """
 
-import json
 import time
-from typing import Callable
+from typing import Any, Callable
 
+import orjson
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import StreamingResponse
 from starlette.types import ASGIApp
 
 from app.logging_config import get_logger
@@ -23,6 +25,34 @@ from app.security import redact_secrets, sanitize_log_data
 logger = get_logger(__name__)
 
 
+async def _read_body(response: StreamingResponse) -> bytes:
+    """Drain a streaming response's body."""
+    chunks = [chunk async for chunk in response.body_iterator]
+    return b"".join(
+        chunk.encode("utf-8") if isinstance(chunk, str) else bytes(chunk)
+        for chunk in chunks
+    )
+
+
+def _replace_json_body(response: Response, data: Any) -> Response:
+    """
+    Re-encode (redacted) JSON data, keeping the original status and headers.
+    
+    Content-Length is dropped so it is recomputed for the new body; every
+    other header (including repeated ones such as Set-Cookie) is kept.
+    """
+    headers = MutableHeaders(raw=[
+        (key, value)
+        for key, value in response.raw_headers
+        if key != b"content-length"
+    ])
+    return Response(
+        content=orjson.dumps(data),
+        status_code=response.status_code,
+        headers=headers,
+    )
+
+
 class PrivacyMiddleware(BaseHTTPMiddleware):
     """
     Middleware that automatically redacts secrets from responses.
@@ -63,25 +93,18 @@ class PrivacyMiddleware(BaseHTTPMiddleware):
             
             if "application/json" in content_type and self.redact_responses:
                 # Read response body
-                body_bytes = b""
-                async for chunk in response.body_iterator:
-                    body_bytes += chunk
+                body_bytes = await _read_body(response)
                 
                 try:
                     # Parse JSON
-                    body_str = body_bytes.decode("utf-8")
-                    body_data = json.loads(body_str)
+                    body_data = orjson.loads(body_bytes)
                     
                     # Redact secrets from response data
                     redacted_data = self._redact_response_data(body_data)
                     
                     # Create new response with redacted data
-                    return JSONResponse(
-                        content=redacted_data,
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
+                    return _replace_json_body(response, redacted_data)
+                except orjson.JSONDecodeError:
                     # If not valid JSON or can't decode, return as-is
                     return Response(
                         content=body_bytes,
@@ -118,7 +141,7 @@ class PrivacyMiddleware(BaseHTTPMiddleware):
             else:
                 error_message = str(e)
             
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "error": "Internal server error",
                     "message": error_message,
@@ -126,7 +149,7 @@ class PrivacyMiddleware(BaseHTTPMiddleware):
                 status_code=500,
             )
     
-    def _redact_response_data(self, data: dict | list | str | any) -> any:
+    def _redact_response_data(self, data: Any) -> Any:
         """
         Recursively redact secrets from response data.
         
@@ -246,23 +269,16 @@ class SecureErrorHandlerMiddleware(BaseHTTPMiddleware):
                 
                 if "application/json" in content_type:
                     # Read error response
-                    body_bytes = b""
-                    async for chunk in response.body_iterator:
-                        body_bytes += chunk
+                    body_bytes = await _read_body(response)
                     
                     try:
-                        body_str = body_bytes.decode("utf-8")
-                        body_data = json.loads(body_str)
+                        body_data = orjson.loads(body_bytes)
                         
                         # Redact any secrets in error messages
                         redacted_data = self._redact_error_data(body_data)
                         
-                        return JSONResponse(
-                            content=redacted_data,
-                            status_code=response.status_code,
-                            headers=dict(response.headers),
-                        )
-                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        return _replace_json_body(response, redacted_data)
+                    except orjson.JSONDecodeError:
                         # If can't parse, return as-is
                         return Response(
                             content=body_bytes,
@@ -283,7 +299,7 @@ class SecureErrorHandlerMiddleware(BaseHTTPMiddleware):
                 exc_info=True,
             )
             
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "error": "Internal server error",
                     "message": error_message,
@@ -291,7 +307,7 @@ class SecureErrorHandlerMiddleware(BaseHTTPMiddleware):
                 status_code=500,
             )
     
-    def _redact_error_data(self, data: dict | list | str | any) -> any:
+    def _redact_error_data(self, data: Any) -> Any:
         """Redact secrets from error data"""
         if isinstance(data, dict):
             return {
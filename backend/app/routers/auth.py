@@ -5,14 +5,16 @@ Email/password and OAuth authentication endpoints.
 """
 from datetime import datetime, timedelta
 from typing import Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
+from uuid import UUID
+import asyncio
 import secrets
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, or_
-import httpx
+import orjson
 
 from app.database import get_db
 from app.config import settings
@@ -27,6 +29,7 @@ from app.utils.auth import (
     validate_username,
 )
 from app.dependencies.auth import get_current_user, get_optional_user
+from app.github_client import get_github_http_client
 from app.logging_config import get_logger
 from pydantic import BaseModel, EmailStr, Field
 
@@ -34,6 +37,22 @@ from pydantic import BaseModel, EmailStr, Field
 router = APIRouter(prefix="/auth", tags=["authentication"])
 logger = get_logger(__name__)
 
+# Fixed attributes of the access_token cookie; only the token value varies per response
+_ACCESS_TOKEN_COOKIE_SECURE = settings.APP_ENV == "production"  # HTTPS only in production
+_ACCESS_TOKEN_COOKIE_MAX_AGE = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def _set_access_token_cookie(response: Response, token: str) -> None:
+    """Set the HTTP-only access_token cookie on a response."""
+    response.set_cookie(
+        key="access_token",
+        value=token,
+        httponly=True,
+        secure=_ACCESS_TOKEN_COOKIE_SECURE,
+        samesite="lax",
+        max_age=_ACCESS_TOKEN_COOKIE_MAX_AGE,
+    )
+
 
 # Pydantic Schemas
 class RegisterRequest(BaseModel):
@@ -51,7 +70,7 @@ class LoginRequest(BaseModel):
 
 class UserResponse(BaseModel):
     """User profile response"""
-    id: str
+    id: UUID
     username: str
     email: Optional[str] = None
     avatar_url: Optional[str] = None
@@ -73,6 +92,27 @@ class LoginResponse(BaseModel):
     user: UserResponse
 
 
+def _build_user_response(user: User) -> UserResponse:
+    """
+    Build a UserResponse from a User row without re-running validation.
+    
+    The fields come straight from the ORM model, so they are already
+    well-typed; model_construct skips the Pydantic validation pass.
+    """
+    auth_provider = user.auth_provider
+    return UserResponse.model_construct(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        avatar_url=user.avatar_url,
+        role=user.role,
+        auth_provider=auth_provider.value if hasattr(auth_provider, "value") else auth_provider,
+        email_verified=user.email_verified,
+        created_at=user.created_at,
+        last_login_at=user.last_login_at
+    )
+
+
 # ============================================================================
 # Email/Password Authentication Endpoints
 # ============================================================================
@@ -150,8 +190,8 @@ async def register(
             detail="Email already registered"
         )
     
-    # Hash password
-    password_hash = hash_password(register_data.password)
+    # Hash password (bcrypt is slow by design; keep it off the event loop)
+    password_hash = await asyncio.to_thread(hash_password, register_data.password)
     
     # Create user
     user = User(
@@ -179,30 +219,13 @@ async def register(
     )
     
     # Set HTTP-only cookie
-    response.set_cookie(
-        key="access_token",
-        value=jwt_token,
-        httponly=True,
-        secure=settings.APP_ENV == "production",
-        samesite="lax",
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    )
+    _set_access_token_cookie(response, jwt_token)
     
     return LoginResponse(
         access_token=jwt_token,
         token_type="bearer",
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse(
-            id=str(user.id),
-            username=user.username,
-            email=user.email,
-            avatar_url=user.avatar_url,
-            role=user.role,
-            auth_provider=user.auth_provider,
-            email_verified=user.email_verified,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at
-        )
+        user=_build_user_response(user)
     )
 
 
@@ -265,8 +288,10 @@ async def login(
             detail=f"This account uses {user.auth_provider.value} authentication. Please use the appropriate login method."
         )
     
-    # Verify password
-    if not user.password_hash or not verify_password(login_data.password, user.password_hash):
+    # Verify password (bcrypt is slow by design; keep it off the event loop)
+    if not user.password_hash or not await asyncio.to_thread(
+        verify_password, login_data.password, user.password_hash
+    ):
         logger.warning(f"Login failed: Invalid password for email {login_data.email}")
         raise invalid_credentials_error
     
@@ -292,30 +317,13 @@ async def login(
     )
     
     # Set HTTP-only cookie
-    response.set_cookie(
-        key="access_token",
-        value=jwt_token,
-        httponly=True,
-        secure=settings.APP_ENV == "production",
-        samesite="lax",
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    )
+    _set_access_token_cookie(response, jwt_token)
     
     return LoginResponse(
         access_token=jwt_token,
         token_type="bearer",
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse(
-            id=str(user.id),
-            username=user.username,
-            email=user.email,
-            avatar_url=user.avatar_url,
-            role=user.role,
-            auth_provider=user.auth_provider,
-            email_verified=user.email_verified,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at
-        )
+        user=_build_user_response(user)
     )
 
 
@@ -327,6 +335,16 @@ async def login(
 # In-memory state storage for OAuth (use Redis in production)
 oauth_states = {}
 
+# Redirect URI registered with GitHub, falling back to the local dev callback
+_GITHUB_REDIRECT_URI = settings.GITHUB_REDIRECT_URI or "http://localhost:8000/api/v1/auth/callback"
+
+# Authorization URL up to the per-request state; only the state varies between logins
+_GITHUB_AUTH_URL_PREFIX = "https://github.com/login/oauth/authorize?" + urlencode({
+    "client_id": settings.GITHUB_CLIENT_ID or "",
+    "redirect_uri": _GITHUB_REDIRECT_URI,
+    "scope": "read:user user:email",
+}) + "&state="
+
 
 @router.get("/login")
 async def github_login(redirect_uri: Optional[str] = None):
@@ -353,29 +371,24 @@ async def github_login(redirect_uri: Optional[str] = None):
             detail="GitHub OAuth not configured"
         )
     
+    now = datetime.utcnow()
+    
     # Generate state for CSRF protection
     state = secrets.token_urlsafe(32)
     oauth_states[state] = {
-        "created_at": datetime.utcnow(),
+        "created_at": now,
         "redirect_uri": redirect_uri
     }
     
     # Clean up old states (older than 10 minutes)
-    cutoff = datetime.utcnow() - timedelta(minutes=10)
+    cutoff = now - timedelta(minutes=10)
     oauth_states_copy = dict(oauth_states)
     for key, value in oauth_states_copy.items():
         if value["created_at"] < cutoff:
             del oauth_states[key]
     
     # Build GitHub authorization URL
-    params = {
-        "client_id": settings.GITHUB_CLIENT_ID,
-        "redirect_uri": settings.GITHUB_REDIRECT_URI or "http://localhost:8000/api/v1/auth/callback",
-        "scope": "read:user user:email",
-        "state": state
-    }
-    
-    github_auth_url = f"https://github.com/login/oauth/authorize?{urlencode(params)}"
+    github_auth_url = _GITHUB_AUTH_URL_PREFIX + quote_plus(state)
     
     return RedirectResponse(url=github_auth_url)
 
@@ -409,15 +422,15 @@ async def github_callback(
     - 400: Invalid state or OAuth error
     - 500: GitHub API error
     """
-    # Verify state
-    if state not in oauth_states:
+    # Verify and consume state in one step (mirrors GETDEL once states live in Redis)
+    state_data = oauth_states.pop(state, None)
+    if state_data is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid state parameter"
         )
     
-    redirect_uri = oauth_states[state].get("redirect_uri")
-    del oauth_states[state]
+    redirect_uri = state_data.get("redirect_uri")
     
     if not settings.GITHUB_CLIENT_ID or not settings.GITHUB_CLIENT_SECRET:
         raise HTTPException(
@@ -425,73 +438,73 @@ async def github_callback(
             detail="GitHub OAuth not configured"
         )
     
-    # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            headers={"Accept": "application/json"},
-            data={
-                "client_id": settings.GITHUB_CLIENT_ID,
-                "client_secret": settings.GITHUB_CLIENT_SECRET,
-                "code": code,
-                "redirect_uri": settings.GITHUB_REDIRECT_URI or "http://localhost:8000/api/v1/auth/callback"
-            }
+    # Exchange code for access token (shared, pooled GitHub client)
+    client = get_github_http_client()
+    token_response = await client.post(
+        "https://github.com/login/oauth/access_token",
+        headers={"Accept": "application/json"},
+        data={
+            "client_id": settings.GITHUB_CLIENT_ID,
+            "client_secret": settings.GITHUB_CLIENT_SECRET,
+            "code": code,
+            "redirect_uri": _GITHUB_REDIRECT_URI
+        }
+    )
+    
+    if token_response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to exchange code for token"
         )
-        
-        if token_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to exchange code for token"
-            )
-        
-        token_data = token_response.json()
-        
-        if "error" in token_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"GitHub OAuth error: {token_data.get('error_description', 'Unknown error')}"
-            )
-        
-        access_token = token_data.get("access_token")
-        
-        if not access_token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No access token received from GitHub"
-            )
-        
-        # Fetch user profile from GitHub
-        user_response = await client.get(
-            "https://api.github.com/user",
+    
+    token_data = token_response.json()
+    
+    if "error" in token_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"GitHub OAuth error: {token_data.get('error_description', 'Unknown error')}"
+        )
+    
+    access_token = token_data.get("access_token")
+    
+    if not access_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No access token received from GitHub"
+        )
+    
+    # Fetch user profile from GitHub
+    user_response = await client.get(
+        "https://api.github.com/user",
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json"
+        }
+    )
+    
+    if user_response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch user profile from GitHub"
+        )
+    
+    github_user = user_response.json()
+    
+    # Fetch user email if not in profile
+    email = github_user.get("email")
+    if not email:
+        emails_response = await client.get(
+            "https://api.github.com/user/emails",
             headers={
                 "Authorization": f"Bearer {access_token}",
                 "Accept": "application/json"
             }
         )
-        
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to fetch user profile from GitHub"
-            )
-        
-        github_user = user_response.json()
-        
-        # Fetch user email if not in profile
-        email = github_user.get("email")
-        if not email:
-            emails_response = await client.get(
-                "https://api.github.com/user/emails",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/json"
-                }
-            )
-            if emails_response.status_code == 200:
-                emails = emails_response.json()
-                primary_email = next((e["email"] for e in emails if e.get("primary")), None)
-                if primary_email:
-                    email = primary_email
+        if emails_response.status_code == 200:
+            emails = orjson.loads(emails_response.content)
+            primary_email = next((e["email"] for e in emails if e.get("primary")), None)
+            if primary_email:
+                email = primary_email
     
     # Create or update user in database
     github_id = github_user["id"]
@@ -540,35 +553,19 @@ async def github_callback(
     await db.commit()
     await db.refresh(user)
     
-    # Generate JWT token
+    # Generate JWT token (signed in a worker thread so login bursts don't stall the event loop)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    jwt_token = create_access_token(
+    jwt_token = await asyncio.to_thread(
+        create_access_token,
         data={"sub": str(user.id), "username": user.username, "role": user.role},
         expires_delta=access_token_expires
     )
     
     # Set HTTP-only cookie
-    response.set_cookie(
-        key="access_token",
-        value=jwt_token,
-        httponly=True,
-        secure=settings.APP_ENV == "production",  # HTTPS only in production
-        samesite="lax",
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    )
+    _set_access_token_cookie(response, jwt_token)
     
     # Prepare response
-    user_response = UserResponse(
-        id=str(user.id),
-        username=user.username,
-        email=user.email,
-        avatar_url=user.avatar_url,
-        role=user.role,
-        auth_provider=user.auth_provider,
-        email_verified=user.email_verified,
-        created_at=user.created_at,
-        last_login_at=user.last_login_at
-    )
+    user_response = _build_user_response(user)
     
     login_response = LoginResponse(
         access_token=jwt_token,
@@ -584,7 +581,7 @@ async def github_callback(
     return login_response
 
 
-@router.get("/me", response_model=UserResponse)
+@router.get("/me", response_model=UserResponse, response_class=ORJSONResponse)
 async def get_current_user_profile(user: User = Depends(get_current_user)):
     """
     Get current authenticated user profile.
@@ -600,17 +597,7 @@ async def get_current_user_profile(user: User = Depends(get_current_user)):
     Cookie: access_token=eyJ...
     ```
     """
-    return UserResponse(
-        id=str(user.id),
-        username=user.username,
-        email=user.email,
-        avatar_url=user.avatar_url,
-        role=user.role,
-        auth_provider=user.auth_provider,
-        email_verified=user.email_verified,
-        created_at=user.created_at,
-        last_login_at=user.last_login_at
-    )
+    return _build_user_response(user)
 
 
 @router.post("/logout")
@@ -639,7 +626,7 @@ async def logout(response: Response, user: Optional[User] = Depends(get_optional
     return {"message": "Successfully logged out"}
 
 
-@router.post("/refresh")
+@router.post("/refresh", response_class=ORJSONResponse)
 async def refresh_token(
     response: Response,
     user: User = Depends(get_current_user)
@@ -658,22 +645,16 @@ async def refresh_token(
     Cookie: access_token=eyJ...
     ```
     """
-    # Generate new token
+    # Generate new token (signed in a worker thread, off the event loop)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    jwt_token = create_access_token(
+    jwt_token = await asyncio.to_thread(
+        create_access_token,
         data={"sub": str(user.id), "username": user.username, "role": user.role},
         expires_delta=access_token_expires
     )
     
     # Update cookie
-    response.set_cookie(
-        key="access_token",
-        value=jwt_token,
-        httponly=True,
-        secure=settings.APP_ENV == "production",
-        samesite="lax",
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    )
+    _set_access_token_cookie(response, jwt_token)
     
     return {
         "access_token": jwt_token,
@@ -5,18 +5,31 @@ RESTful API endpoints for managing and querying security findings.
 All endpoints are privacy-safe and never expose actual secrets.
 """
 
-from datetime import datetime, timedelta
-from typing import Literal
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, desc, func, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Select, and_, desc, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
+from sqlalchemy.orm import raiseload
+from pydantic import ValidationError
 
 from app.database import get_db
 from app.logging_config import get_logger
 from app.models import Finding, Repository, Scan
+from app.security import hash_secrets_batch_async, redact_secrets
+from app.routers.statistics import invalidate_statistics_cache
 from app.schemas import (
+    FindingCreate,
     FindingListResponse,
     FindingResponse,
     FindingStatistics,
@@ -29,6 +42,56 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/findings", tags=["Findings"])
 
 
+# ============================================================================
+# Pagination Cursors
+# ============================================================================
+
+def _encode_cursor(sort_by: str, sort_order: str, finding: Finding) -> str:
+    """
+    Encode the (sort value, id) position of a finding as an opaque cursor.
+    
+    The sort it was issued for is stored with the position, so the cursor
+    cannot be replayed against a different ordering.
+    """
+    value: Any = getattr(finding, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, sort_order, value, str(finding.id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_cursor(sort_by: str, sort_order: str, cursor: str) -> tuple[Any, UUID]:
+    """
+    Decode a cursor produced by _encode_cursor.
+    
+    Raises:
+        HTTPException 400: If the cursor is malformed or was issued for a
+            different sort_by/sort_order
+    """
+    try:
+        cursor_sort_by, cursor_sort_order, value, finding_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        if not isinstance(value, str) or not isinstance(finding_id, str):
+            raise TypeError("cursor values must be strings")
+        if sort_by == "created_at":
+            value = datetime.fromisoformat(value)
+        position = (value, UUID(finding_id))
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    
+    if (cursor_sort_by, cursor_sort_order) != (sort_by, sort_order):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pagination cursor was issued for a different sort_by/sort_order"
+        )
+    
+    return position
+
+
 # ============================================================================
 # List Findings Endpoint
 # ============================================================================
@@ -38,6 +101,7 @@ async def list_findings(
     # Pagination
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    after: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
     
     # Filtering
     repository_id: UUID | None = Query(None, description="Filter by repository"),
@@ -79,10 +143,14 @@ async def list_findings(
     **Pagination:**
     - `page`: Page number (starting from 1)
     - `page_size`: Items per page (max 100)
+    - `after`: Cursor from a previous response's `next_cursor`. When set,
+      the page is located by seeking past the cursor instead of by OFFSET,
+      `page` is ignored, and `total`/`total_pages` are not computed.
     
     **Returns:**
     - List of findings with metadata
     - Total count and pagination info
+    - `next_cursor` for fetching the following page (null on the last page)
     - NEVER includes actual secret values
     """
     logger.info(
@@ -91,8 +159,17 @@ async def list_findings(
         f"secret_type={secret_type}, severity={severity}"
     )
     
-    # Build query
-    query = select(Finding).where(Finding.deleted_at.is_(None))
+    # Build query; in offset mode the window count returns the total alongside each row
+    query: Select
+    if after:
+        query = select(Finding).where(Finding.deleted_at.is_(None))
+    else:
+        query = select(Finding, func.count().over().label("total")).where(
+            Finding.deleted_at.is_(None)
+        )
+    
+    # FindingResponse only reads columns; fail loudly instead of lazy-loading per row
+    query = query.options(raiseload("*"))
     
     # Apply filters
     filters = []
@@ -116,34 +193,53 @@ async def list_findings(
     if filters:
         query = query.where(and_(*filters))
     
-    # Count total results
-    count_query = select(func.count()).select_from(Finding).where(Finding.deleted_at.is_(None))
-    if filters:
-        count_query = count_query.where(and_(*filters))
-    
-    result = await db.execute(count_query)
-    total = result.scalar() or 0
-    
-    # Apply sorting
+    # Apply sorting (id breaks ties so every row has a unique cursor position)
     sort_column = getattr(Finding, sort_by)
     if sort_order == "desc":
-        query = query.order_by(desc(sort_column))
+        query = query.order_by(desc(sort_column), desc(Finding.id))
     else:
-        query = query.order_by(sort_column)
-    
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+        query = query.order_by(sort_column, Finding.id)
+    
+    # Apply pagination, fetching one extra row to tell whether a next page exists
+    offset = 0
+    if after:
+        cursor_position = tuple_(*_decode_cursor(sort_by, sort_order, after))
+        if sort_order == "desc":
+            query = query.where(tuple_(sort_column, Finding.id) < cursor_position)
+        else:
+            query = query.where(tuple_(sort_column, Finding.id) > cursor_position)
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+    query = query.limit(page_size + 1)
     
     # Execute query
     result = await db.execute(query)
-    findings = result.scalars().all()
+    rows = result.all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    findings = [row[0] for row in rows]
+    next_cursor = _encode_cursor(sort_by, sort_order, findings[-1]) if has_more else None
+    
+    if after:
+        total = None
+    elif rows:
+        total = rows[0].total
+    elif offset:
+        # Page is past the end, so no row carried the total; count separately
+        count_query = select(func.count(Finding.id)).where(Finding.deleted_at.is_(None))
+        if filters:
+            count_query = count_query.where(and_(*filters))
+        result = await db.execute(count_query)
+        total = result.scalar() or 0
+    else:
+        total = 0
     
     # Convert to response schema
-    finding_responses = [FindingResponse.model_validate(f) for f in findings]
+    finding_responses = [FindingResponse.from_orm_fast(f) for f in findings]
     
     # Calculate pagination info
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
     
     logger.info(f"Found {total} findings, returning page {page}/{total_pages}")
     
@@ -153,7 +249,130 @@ async def list_findings(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+# ============================================================================
+# Batch Create Findings
+# ============================================================================
+
+# FindingCreate fields stored under a different column name
+_FINDING_CREATE_COLUMNS = {
+    "column_start": "start_column",
+    "column_end": "end_column",
+    "line_content_before": "context_before",
+    "line_content_after": "context_after",
+}
+
+# Columns documented as sanitized (no secrets); client-supplied context
+# lines are redacted before they are stored
+_REDACTED_COLUMNS = frozenset({"context_before", "context_after"})
+
+
+def _finding_row(finding: FindingCreate, match_text_hash: str) -> dict[str, Any]:
+    """Map a validated FindingCreate onto findings table columns."""
+    row: dict[str, Any] = {"match_text_hash": match_text_hash}
+    for field, value in finding:
+        column = _FINDING_CREATE_COLUMNS.get(field, field)
+        if column in _REDACTED_COLUMNS and value:
+            value = redact_secrets(value)
+        if column in Finding.__table__.columns:
+            row[column] = value
+    return row
+
+
+@router.post(
+    "/batch",
+    response_model=list[UUID],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_findings_batch(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> list[UUID]:
+    """
+    Store a batch of findings from a scan in a single INSERT.
+    
+    Each matched secret is hashed (off the event loop) and discarded;
+    only the hash is stored. Findings already recorded for the same scan,
+    file, line and hash are skipped, so re-uploading a batch is safe.
+    
+    **Body:** JSON array of findings (`FindingCreate`). The raw body is
+    parsed and validated in one pass instead of through FastAPI's
+    per-field body validation.
+    
+    **Returns:** IDs of the newly created findings
+    
+    **Errors:**
+    - 400: A finding's scan belongs to a different repository
+    - 404: A finding references a scan that doesn't exist
+    - 409: A referenced scan or repository was deleted during the upload
+    - 422: Malformed JSON or an invalid finding
+    
+    **Privacy Note**: `matched_secret` is NEVER stored or logged.
+    """
+    try:
+        findings = FindingCreate.model_validate_json_many(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False, include_input=False)
+        ])
+    
+    logger.info(f"Creating {len(findings)} findings")
+    
+    if not findings:
+        return []
+    
+    # Check every (scan, repository) pair in one query up front, rather than
+    # letting a foreign key violation fail the INSERT
+    scan_repositories: dict[UUID, UUID] = dict((await db.execute(
+        select(Scan.id, Scan.repository_id)
+        .where(Scan.id.in_({f.scan_id for f in findings}))
+    )).tuples().all())
+    for scan_id, repository_id in dict.fromkeys((f.scan_id, f.repository_id) for f in findings):
+        if scan_id not in scan_repositories:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Scan {scan_id} not found"
+            )
+        if scan_repositories[scan_id] != repository_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Scan {scan_id} does not belong to repository {repository_id}"
+            )
+    
+    hashes = await hash_secrets_batch_async([f.matched_secret for f in findings])
+    rows = [_finding_row(f, h) for f, h in zip(findings, hashes)]
+    
+    query: ReturningInsert = (
+        insert(Finding)
+        .on_conflict_do_nothing(constraint="unique_finding_per_scan")
+        .returning(Finding.id)
     )
+    try:
+        result = await db.execute(query, rows)
+    except IntegrityError:
+        # A scan or repository was deleted after the check above
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A referenced scan or repository no longer exists"
+        )
+    created_ids = list(result.scalars())
+    
+    await db.commit()
+    
+    # Cached statistics for the affected repositories are now stale
+    await invalidate_statistics_cache(*{f.repository_id for f in findings})
+    
+    logger.info(
+        f"Created {len(created_ids)} findings "
+        f"({len(findings) - len(created_ids)} duplicates skipped)"
+    )
+    
+    return created_ids
 
 
 # ============================================================================
@@ -202,7 +421,7 @@ async def get_finding(
     
     logger.info(f"Found finding: {finding_id} in {finding.file_path}")
     
-    return FindingResponse.model_validate(finding)
+    return FindingResponse.from_orm_fast(finding)
 
 
 # ============================================================================
@@ -233,12 +452,33 @@ async def update_finding(
     """
     logger.info(f"Updating finding: {finding_id}")
     
-    # Query finding
-    query = select(Finding).where(
-        and_(
-            Finding.id == finding_id,
-            Finding.deleted_at.is_(None)
+    now = datetime.now(timezone.utc)
+    
+    # Only mapped columns can be written in an UPDATE statement
+    update_data = finding_update.model_dump(exclude_unset=True)
+    values = {
+        field: value
+        for field, value in update_data.items()
+        if field in Finding.__table__.columns
+    }
+    values["updated_at"] = now
+    
+    # If status changed to fixed/ignored/false_positive, set resolved_at
+    # (keeping the original timestamp if it was already resolved)
+    if finding_update.status and finding_update.status != "open":
+        values["resolved_at"] = func.coalesce(Finding.resolved_at, now)
+    
+    # Update and fetch the row in a single round-trip
+    query = (
+        update(Finding)
+        .where(
+            and_(
+                Finding.id == finding_id,
+                Finding.deleted_at.is_(None)
+            )
         )
+        .values(**values)
+        .returning(Finding)
     )
     
     result = await db.execute(query)
@@ -251,34 +491,26 @@ async def update_finding(
             detail=f"Finding {finding_id} not found"
         )
     
-    # Update fields
-    update_data = finding_update.model_dump(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        setattr(finding, field, value)
-    
-    # If status changed to fixed/ignored/false_positive, set resolved_at
-    if finding_update.status and finding_update.status != "open":
-        if not finding.resolved_at:
-            finding.resolved_at = datetime.utcnow()
-    
-    # Update last_seen_at
-    finding.last_seen_at = datetime.utcnow()
-    
     # Commit changes
     await db.commit()
-    await db.refresh(finding)
+    
+    # Cached statistics for this repository are now stale
+    await invalidate_statistics_cache(finding.repository_id)
     
     logger.info(f"Updated finding {finding_id}: status={finding.status}")
     
-    return FindingResponse.model_validate(finding)
+    return FindingResponse.from_orm_fast(finding)
 
 
 # ============================================================================
 # Get Related Findings
 # ============================================================================
 
-@router.get("/{finding_id}/related", response_model=FindingListResponse)
+@router.get(
+    "/{finding_id}/related",
+    response_model=FindingListResponse,
+    response_class=ORJSONResponse,
+)
 async def get_related_findings(
     finding_id: UUID,
     page: int = Query(1, ge=1),
@@ -298,6 +530,8 @@ async def get_related_findings(
     """
     logger.info(f"Fetching related findings for: {finding_id}")
     
+    now = datetime.now(timezone.utc)
+    
     # Get the original finding
     query = select(Finding).where(Finding.id == finding_id)
     result = await db.execute(query)
@@ -312,50 +546,51 @@ async def get_related_findings(
     # Extract directory from file path
     file_dir = "/".join(original.file_path.split("/")[:-1])
     
-    # Build query for related findings
-    query = select(Finding).where(
-        and_(
-            Finding.id != finding_id,  # Exclude the original
-            Finding.repository_id == original.repository_id,
-            Finding.secret_type == original.secret_type,
-            Finding.deleted_at.is_(None),
-            # Same directory or nearby
-            or_(
-                Finding.file_path.like(f"{file_dir}/%"),
-                Finding.file_path == original.file_path,
-            ),
-            # Within 30 days
-            Finding.created_at >= datetime.utcnow() - timedelta(days=30)
-        )
-    ).order_by(desc(Finding.created_at))
-    
-    # Count total
-    count_query = select(func.count()).select_from(Finding).where(
-        and_(
-            Finding.id != finding_id,
-            Finding.repository_id == original.repository_id,
-            Finding.secret_type == original.secret_type,
-            Finding.deleted_at.is_(None),
-            or_(
-                Finding.file_path.like(f"{file_dir}/%"),
-                Finding.file_path == original.file_path,
-            ),
-            Finding.created_at >= datetime.utcnow() - timedelta(days=30)
-        )
+    # Related-finding predicates, shared by the page query and the count fallback
+    filters = [
+        Finding.id != finding_id,  # Exclude the original
+        Finding.repository_id == original.repository_id,
+        Finding.secret_type == original.secret_type,
+        Finding.deleted_at.is_(None),
+        # Same directory or nearby
+        or_(
+            Finding.file_path.like(f"{file_dir}/%"),
+            Finding.file_path == original.file_path,
+        ),
+        # Within 30 days
+        Finding.created_at >= now - timedelta(days=30),
+    ]
+    
+    # Build query; the window count returns the total alongside each row
+    query = (
+        select(Finding, func.count().over().label("total"))
+        .options(raiseload("*"))  # Never lazy-load relationships per row
+        .where(and_(*filters))
+        .order_by(desc(Finding.created_at))
     )
     
-    result = await db.execute(count_query)
-    total = result.scalar() or 0
-    
     # Apply pagination
     offset = (page - 1) * page_size
     query = query.offset(offset).limit(page_size)
     
-    result = await db.execute(query)
-    findings = result.scalars().all()
+    # Stream rows through a server-side cursor and convert them as they
+    # arrive, so the page is never held as both ORM objects and responses
+    result = await db.stream(query.execution_options(yield_per=50))
+    finding_responses = []
+    total = None
+    async for finding, row_total in result:
+        total = row_total
+        finding_responses.append(FindingResponse.from_orm_fast(finding))
+    
+    if total is None:
+        if offset:
+            # Page is past the end, so no row carried the total; count separately
+            count_query = select(func.count(Finding.id)).where(and_(*filters))
+            result = await db.execute(count_query)
+            total = result.scalar() or 0
+        else:
+            total = 0
     
-    # Convert to response
-    finding_responses = [FindingResponse.model_validate(f) for f in findings]
     total_pages = (total + page_size - 1) // page_size
     
     logger.info(f"Found {total} related findings")
@@ -3,11 +3,16 @@ GitHub Router
 
 GitHub API integration endpoints for fetching user profile and repository data.
 """
-from typing import List, Optional
+import time
+from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 import httpx
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import cache_get_json, cache_set_json
+from app.config import settings
 from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User
@@ -50,16 +55,122 @@ class GitHubRepository(BaseModel):
     pushed_at: Optional[str] = None
 
 
-async def get_github_client(user: User) -> httpx.AsyncClient:
-    """Create authenticated GitHub API client"""
+# Mock repository data (per-user fields are filled in by get_github_repositories)
+_MOCK_REPOSITORIES: tuple[dict[str, Any], ...] = (
+    {
+        "id": 1,
+        "name": "gitzen",
+        "description": "Privacy-first Git secret detection and cleanup tool",
+        "private": False,
+        "language": "Python",
+        "stargazers_count": 15,
+        "forks_count": 3,
+        "updated_at": "2025-10-14T10:30:00Z",
+        "pushed_at": "2025-10-14T10:30:00Z",
+    },
+    {
+        "id": 2,
+        "name": "my-awesome-app",
+        "description": "A sample web application",
+        "private": True,
+        "language": "TypeScript",
+        "stargazers_count": 8,
+        "forks_count": 1,
+        "updated_at": "2025-10-13T15:20:00Z",
+        "pushed_at": "2025-10-13T15:20:00Z",
+    },
+    {
+        "id": 3,
+        "name": "dotfiles",
+        "description": "My personal configuration files",
+        "private": False,
+        "language": "Shell",
+        "stargazers_count": 2,
+        "forks_count": 0,
+        "updated_at": "2025-10-12T09:15:00Z",
+        "pushed_at": "2025-10-12T09:15:00Z",
+    },
+)
+
+
+async def get_github_client(user: User) -> tuple[httpx.AsyncClient, dict[str, str]]:
+    """
+    Get the shared GitHub API client and auth headers for a user.
+    
+    The client is pooled across requests, so it carries no credentials
+    and must not be closed by callers; send the returned headers (the
+    user's Authorization) with every request made on it.
+    """
     # For now, return mock data since we're storing hashed tokens
-    # TODO: Implement proper token storage and retrieval
+    # TODO: Implement proper token storage and retrieval, then return
+    # get_github_http_client(), {"Authorization": f"Bearer {token}"}
     raise HTTPException(
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
         detail="GitHub API integration is being implemented. Mock data will be returned in the frontend."
     )
 
 
+# How long a cached GitHub body (and its ETag) is kept for revalidation
+# after it goes stale; fresh entries are served without calling GitHub.
+_GITHUB_ETAG_RETENTION_SECONDS = 24 * 60 * 60
+
+
+async def _cached_github_get(
+    client: httpx.AsyncClient,
+    path: str,
+    cache_key: str,
+    auth_headers: dict[str, str],
+) -> tuple[int, Any]:
+    """
+    GET a GitHub API path through the per-user response cache.
+    
+    Entries younger than GITHUB_CACHE_TTL_SECONDS are returned directly.
+    Stale entries are revalidated with If-None-Match, so a 304 from GitHub
+    refreshes the entry without downloading (or counting against the rate
+    limit for) the body again.
+    
+    Args:
+        client: Shared GitHub client
+        path: API path to fetch
+        cache_key: Per-user cache key for the response
+        auth_headers: The user's Authorization header, sent on every
+            request (including revalidations) so private resources are
+            visible and the user's rate limit applies
+    
+    Returns:
+        tuple: (status_code, decoded body or None if the status is not 200)
+    """
+    cached = await cache_get_json(cache_key)
+    now = time.time()
+    
+    if cached and now - cached["fetched_at"] < settings.GITHUB_CACHE_TTL_SECONDS:
+        return 200, cached["body"]
+    
+    headers = dict(auth_headers)
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    response = await client.get(path, headers=headers)
+    
+    if response.status_code == 304 and cached:
+        cached["fetched_at"] = now
+        await cache_set_json(cache_key, cached, _GITHUB_ETAG_RETENTION_SECONDS)
+        return 200, cached["body"]
+    
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    body = orjson.loads(response.content)
+    etag = response.headers.get("ETag")
+    if etag:
+        await cache_set_json(
+            cache_key,
+            {"etag": etag, "fetched_at": now, "body": body},
+            _GITHUB_ETAG_RETENTION_SECONDS,
+        )
+    
+    return 200, body
+
+
 @router.get("/profile", response_model=GitHubProfile)
 async def get_github_profile(
     user: User = Depends(get_current_user),
@@ -93,7 +204,11 @@ async def get_github_profile(
     )
 
 
-@router.get("/repositories", response_model=List[GitHubRepository])
+@router.get(
+    "/repositories",
+    response_model=List[GitHubRepository],
+    response_class=ORJSONResponse,
+)
 async def get_github_repositories(
     user: User = Depends(get_current_user),
     per_page: int = 30,
@@ -117,54 +232,19 @@ async def get_github_repositories(
     logger.info(f"Fetching GitHub repositories for user: {user.username}")
     
     # Return mock data for now - TODO: Implement real GitHub API calls
-    mock_repos = [
-        GitHubRepository(
-            id=1,
-            name="gitzen",
-            full_name=f"{user.username}/gitzen",
-            description="Privacy-first Git secret detection and cleanup tool",
-            private=False,
-            html_url=f"https://github.com/{user.username}/gitzen",
-            language="Python",
-            stargazers_count=15,
-            forks_count=3,
-            updated_at="2025-10-14T10:30:00Z",
-            pushed_at="2025-10-14T10:30:00Z"
-        ),
-        GitHubRepository(
-            id=2,
-            name="my-awesome-app",
-            full_name=f"{user.username}/my-awesome-app",
-            description="A sample web application",
-            private=True,
-            html_url=f"https://github.com/{user.username}/my-awesome-app",
-            language="TypeScript",
-            stargazers_count=8,
-            forks_count=1,
-            updated_at="2025-10-13T15:20:00Z",
-            pushed_at="2025-10-13T15:20:00Z"
-        ),
-        GitHubRepository(
-            id=3,
-            name="dotfiles",
-            full_name=f"{user.username}/dotfiles",
-            description="My personal configuration files",
-            private=False,
-            html_url=f"https://github.com/{user.username}/dotfiles",
-            language="Shell",
-            stargazers_count=2,
-            forks_count=0,
-            updated_at="2025-10-12T09:15:00Z",
-            pushed_at="2025-10-12T09:15:00Z"
-        )
-    ]
-    
     # Limit results based on pagination
     per_page = min(per_page, 100)
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
     
-    return mock_repos[start_idx:end_idx]
+    return [
+        GitHubRepository.model_construct(
+            **repo,
+            full_name=f"{user.username}/{repo['name']}",
+            html_url=f"https://github.com/{user.username}/{repo['name']}",
+        )
+        for repo in _MOCK_REPOSITORIES[start_idx:end_idx]
+    ]
 
 
 @router.get("/repository/{repo_name}", response_model=GitHubRepository)
@@ -198,41 +278,44 @@ async def get_github_repository(
         )
     
     try:
-        async with await get_github_client(user) as client:
-            response = await client.get(f"/repos/{user.username}/{repo_name}")
-            
-            if response.status_code == 401:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="GitHub access token is invalid. Please re-authenticate."
-                )
-            elif response.status_code == 404:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Repository '{repo_name}' not found"
-                )
-            elif response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"GitHub API error: {response.status_code}"
-                )
-            
-            repo = response.json()
-            
-            return GitHubRepository(
-                id=repo.get("id", 0),
-                name=repo.get("name", ""),
-                full_name=repo.get("full_name", ""),
-                description=repo.get("description"),
-                private=repo.get("private", False),
-                html_url=repo.get("html_url", ""),
-                language=repo.get("language"),
-                stargazers_count=repo.get("stargazers_count", 0),
-                forks_count=repo.get("forks_count", 0),
-                updated_at=repo.get("updated_at", ""),
-                pushed_at=repo.get("pushed_at")
+        client, auth_headers = await get_github_client(user)
+        status_code, repo = await _cached_github_get(
+            client,
+            f"/repos/{user.username}/{repo_name}",
+            f"gh:{user.id}:repo:{repo_name}",
+            auth_headers,
+        )
+        
+        if status_code == 401:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="GitHub access token is invalid. Please re-authenticate."
             )
-            
+        elif status_code == 404:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Repository '{repo_name}' not found"
+            )
+        elif status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"GitHub API error: {status_code}"
+            )
+        
+        return GitHubRepository(
+            id=repo.get("id", 0),
+            name=repo.get("name", ""),
+            full_name=repo.get("full_name", ""),
+            description=repo.get("description"),
+            private=repo.get("private", False),
+            html_url=repo.get("html_url", ""),
+            language=repo.get("language"),
+            stargazers_count=repo.get("stargazers_count", 0),
+            forks_count=repo.get("forks_count", 0),
+            updated_at=repo.get("updated_at", ""),
+            pushed_at=repo.get("pushed_at")
+        )
+        
     except httpx.RequestError as e:
         logger.error(f"GitHub API request failed: {e}")
         raise HTTPException(
@@ -4,14 +4,20 @@ Statistics API Router
 Provides aggregate metrics and analytics for findings.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Interval, Row, Select, and_, bindparam, func, literal_column, select
+from sqlalchemy.sql.elements import BindParameter, ColumnElement
+from sqlalchemy.sql.selectable import TableValuedAlias
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import get_db
+from app.cache import cache_get_json, cache_invalidate, cache_set_json
+from app.config import settings
+from app.database import get_db, get_session_factory
 from app.logging_config import get_logger
 from app.models import Finding, Repository
 from app.schemas import FindingStatistics
@@ -21,13 +27,131 @@ logger = get_logger(__name__)
 # Create router
 router = APIRouter(prefix="/statistics", tags=["Statistics"])
 
+# Buckets reported by get_statistics (mirrors the Literal types in app.schemas)
+_FINDING_STATUSES = ("open", "fixed", "ignored", "false_positive")
+_FINDING_SEVERITIES = ("critical", "high", "medium", "low", "info")
 
-@router.get("", response_model=FindingStatistics)
+
+def _statistics_cache_key(repository_id: UUID | None, days: int) -> str:
+    """Cache key for a get_statistics response."""
+    return f"stats:{repository_id or 'all'}:{days}"
+
+
+async def invalidate_statistics_cache(*repository_ids: UUID) -> None:
+    """
+    Drop cached statistics affected by a change to repositories' findings.
+    
+    Clears both the repository-scoped entries and the global ones, for
+    every trending window, in a single cache invalidation.
+    """
+    await cache_invalidate(
+        *(f"stats:{repository_id}:*" for repository_id in repository_ids),
+        "stats:all:*",
+    )
+
+
+def _summary_statement(*criteria: ColumnElement[bool]) -> Select:
+    """Total, per-status, per-severity and trend counts in a single pass."""
+    cutoff: BindParameter[datetime] = bindparam("cutoff")
+    return (
+        select(
+            func.count().label("total"),
+            *(
+                func.count().filter(Finding.status == value).label(f"status_{value}")
+                for value in _FINDING_STATUSES
+            ),
+            *(
+                func.count().filter(Finding.severity == value).label(f"severity_{value}")
+                for value in _FINDING_SEVERITIES
+            ),
+            func.count().filter(Finding.created_at >= cutoff).label("trend_new"),
+            func.count().filter(
+                and_(
+                    Finding.status == "fixed",
+                    Finding.resolved_at >= cutoff
+                )
+            ).label("trend_fixed"),
+        )
+        .select_from(Finding)
+        .where(Finding.deleted_at.is_(None), *criteria)
+    )
+
+
+def _secret_type_statement(*criteria: ColumnElement[bool]) -> Select:
+    """Top 10 secret types by finding count."""
+    return (
+        select(Finding.secret_type, func.count())
+        .where(Finding.deleted_at.is_(None), *criteria)
+        .group_by(Finding.secret_type)
+        .order_by(func.count().desc())
+        .limit(10)
+    )
+
+
+# get_statistics statements are built once so SQLAlchemy's compiled cache
+# is hit on every call; per-request values are bound at execution time.
+_REPOSITORY_FILTER: ColumnElement[bool] = Finding.repository_id == bindparam("repository_id")
+
+_SUMMARY_STMT = _summary_statement()
+_SUMMARY_STMT_REPO = _summary_statement(_REPOSITORY_FILTER)
+_SECRET_TYPE_STMT = _secret_type_statement()
+_SECRET_TYPE_STMT_REPO = _secret_type_statement(_REPOSITORY_FILTER)
+_REPOSITORY_STMT: Select = (
+    select(Repository.full_name, func.count(Finding.id))
+    .join(Finding, Repository.id == Finding.repository_id)
+    .where(Finding.deleted_at.is_(None))
+    .group_by(Repository.full_name)
+    .order_by(func.count(Finding.id).desc())
+    .limit(10)  # Top 10 repositories
+)
+
+
+# Step between trend buckets, rendered as SQL literals: asyncpg only
+# accepts timedelta parameters for INTERVAL, and a month is not one
+_TREND_STEPS: dict[str, ColumnElement[timedelta]] = {
+    interval: literal_column(f"INTERVAL '1 {interval}'", Interval)
+    for interval in ("day", "week", "month")
+}
+
+
+def _trend_buckets(interval: str, start: datetime, end: datetime) -> TableValuedAlias:
+    """Every `interval` bucket from `start` to `end`, as a derived table."""
+    return (
+        func.generate_series(
+            func.date_trunc(interval, start),
+            func.date_trunc(interval, end),
+            _TREND_STEPS[interval],
+        )
+        .table_valued("bucket")
+        .render_derived(name="buckets")
+    )
+
+
+async def _fetch_all(
+    session_factory: async_sessionmaker[AsyncSession],
+    slots: asyncio.Semaphore,
+    statement: Select,
+    params: dict | None = None,
+) -> list[Row]:
+    """
+    Execute a read-only statement on its own short-lived session.
+    
+    An AsyncSession cannot run statements concurrently, so each query
+    fanned out with asyncio.gather gets a separate session (and pooled
+    connection). `slots` caps how many of them run, and so how many
+    connections the request holds, at once.
+    """
+    async with slots, session_factory() as session:
+        result = await session.execute(statement, params)
+        return result.all()
+
+
+@router.get("", response_model=FindingStatistics, response_class=ORJSONResponse)
 async def get_statistics(
     repository_id: UUID | None = Query(None, description="Filter by repository"),
     days: int = Query(30, ge=1, le=365, description="Days to analyze for trending"),
-    db: AsyncSession = Depends(get_db),
-) -> FindingStatistics:
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> ORJSONResponse:
     """
     Get aggregate statistics and metrics for findings.
     
@@ -43,99 +167,61 @@ async def get_statistics(
     - `repository_id`: Limit stats to specific repository
     - `days`: Number of days for trending analysis (default 30)
     
+    **Caching:** Responses are cached in Redis for
+    `STATISTICS_CACHE_TTL_SECONDS` and invalidated when findings change.
+    
     **Privacy Note**: All aggregated, no secret values exposed.
     """
+    cache_key = _statistics_cache_key(repository_id, days)
+    # Responses are returned directly: the counts come from our own queries
+    # (or a cache entry written here), so re-validating them is wasted work
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     logger.info(f"Generating statistics: repository_id={repository_id}, days={days}")
     
-    # Base filter
-    base_filter = Finding.deleted_at.is_(None)
+    # Trending data (last N days)
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+    
+    slots = asyncio.Semaphore(settings.STATISTICS_MAX_CONCURRENT_QUERIES)
     if repository_id:
-        base_filter = and_(base_filter, Finding.repository_id == repository_id)
+        # Breakdown by repository is only needed across all repositories
+        params = {"repository_id": repository_id, "cutoff": cutoff_date}
+        queries = [
+            _fetch_all(session_factory, slots, _SUMMARY_STMT_REPO, params),
+            _fetch_all(session_factory, slots, _SECRET_TYPE_STMT_REPO, params),
+        ]
+    else:
+        queries = [
+            _fetch_all(session_factory, slots, _SUMMARY_STMT, {"cutoff": cutoff_date}),
+            _fetch_all(session_factory, slots, _SECRET_TYPE_STMT),
+            _fetch_all(session_factory, slots, _REPOSITORY_STMT),
+        ]
     
-    # Total findings
-    total_query = select(func.count()).select_from(Finding).where(base_filter)
-    result = await db.execute(total_query)
-    total_findings = result.scalar() or 0
+    # The queries are independent, so run them concurrently (at most
+    # STATISTICS_MAX_CONCURRENT_QUERIES at a time)
+    results = await asyncio.gather(*queries)
     
-    # Breakdown by status
-    status_query = (
-        select(Finding.status, func.count())
-        .where(base_filter)
-        .group_by(Finding.status)
-    )
-    result = await db.execute(status_query)
-    status_counts = {row[0]: row[1] for row in result}
-    
-    open_findings = status_counts.get("open", 0)
-    fixed_findings = status_counts.get("fixed", 0)
-    ignored_findings = status_counts.get("ignored", 0)
-    false_positives = status_counts.get("false_positive", 0)
-    
-    # Breakdown by severity
-    severity_query = (
-        select(Finding.severity, func.count())
-        .where(base_filter)
-        .group_by(Finding.severity)
-    )
-    result = await db.execute(severity_query)
-    by_severity = {row[0]: row[1] for row in result}
+    summary = results[0][0]._mapping
     
-    # Breakdown by secret type
-    type_query = (
-        select(Finding.secret_type, func.count())
-        .where(base_filter)
-        .group_by(Finding.secret_type)
-        .order_by(func.count().desc())
-        .limit(10)  # Top 10
-    )
-    result = await db.execute(type_query)
-    by_secret_type = {row[0]: row[1] for row in result}
-    
-    # Breakdown by repository (if not filtering by single repo)
-    by_repository = {}
-    if not repository_id:
-        repo_query = (
-            select(Repository.full_name, func.count(Finding.id))
-            .join(Finding, Repository.id == Finding.repository_id)
-            .where(base_filter)
-            .group_by(Repository.full_name)
-            .order_by(func.count(Finding.id).desc())
-            .limit(10)  # Top 10 repositories
-        )
-        result = await db.execute(repo_query)
-        by_repository = {row[0]: row[1] for row in result}
+    total_findings = summary["total"]
+    open_findings = summary["status_open"]
+    fixed_findings = summary["status_fixed"]
+    ignored_findings = summary["status_ignored"]
+    false_positives = summary["status_false_positive"]
     
-    # Trending data (last N days)
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    # Only severities that occur, matching the shape of a GROUP BY breakdown
+    by_severity = {
+        value: summary[f"severity_{value}"]
+        for value in _FINDING_SEVERITIES
+        if summary[f"severity_{value}"]
+    }
+    by_secret_type = {row[0]: row[1] for row in results[1]}
+    by_repository = {row[0]: row[1] for row in results[2]} if not repository_id else {}
     
-    # New findings in period
-    new_query = (
-        select(func.count())
-        .select_from(Finding)
-        .where(
-            and_(
-                base_filter,
-                Finding.created_at >= cutoff_date
-            )
-        )
-    )
-    result = await db.execute(new_query)
-    trend_new = result.scalar() or 0
-    
-    # Fixed findings in period
-    fixed_query = (
-        select(func.count())
-        .select_from(Finding)
-        .where(
-            and_(
-                base_filter,
-                Finding.status == "fixed",
-                Finding.resolved_at >= cutoff_date
-            )
-        )
-    )
-    result = await db.execute(fixed_query)
-    trend_fixed = result.scalar() or 0
+    trend_new = summary["trend_new"]
+    trend_fixed = summary["trend_fixed"]
     
     # Calculate trend percentage
     if trend_new > 0:
@@ -148,7 +234,7 @@ async def get_statistics(
         f"fixed={fixed_findings}, trend_new={trend_new}, trend_fixed={trend_fixed}"
     )
     
-    return FindingStatistics(
+    statistics = FindingStatistics.model_construct(
         total_findings=total_findings,
         open_findings=open_findings,
         fixed_findings=fixed_findings,
@@ -161,6 +247,11 @@ async def get_statistics(
         trend_fixed=trend_fixed,
         trend_change_percent=round(trend_change_percent, 2),
     )
+    
+    content = statistics.model_dump()
+    await cache_set_json(cache_key, content, settings.STATISTICS_CACHE_TTL_SECONDS)
+    
+    return ORJSONResponse(content)
 
 
 @router.get("/trends", response_model=dict)
@@ -177,6 +268,7 @@ async def get_trends(
     - Time-series data showing findings over time
     - Can be grouped by day, week, or month
     - Shows new findings vs fixed findings
+    - Intervals without activity are included with zero counts
     
     **Parameters:**
     - `repository_id`: Limit to specific repository
@@ -190,15 +282,57 @@ async def get_trends(
     if repository_id:
         base_filter = and_(base_filter, Finding.repository_id == repository_id)
     
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.now(timezone.utc)
+    cutoff_date = now - timedelta(days=days)
+    
+    # Every bucket in the window, so intervals without findings report zero
+    buckets = _trend_buckets(interval, cutoff_date, now)
+    
+    new_counts = (
+        select(
+            func.date_trunc(interval, Finding.created_at).label("bucket"),
+            func.count().label("count"),
+        )
+        .where(base_filter, Finding.created_at >= cutoff_date)
+        .group_by(literal_column("1"))
+        .subquery()
+    )
+    fixed_counts = (
+        select(
+            func.date_trunc(interval, Finding.resolved_at).label("bucket"),
+            func.count().label("count"),
+        )
+        .where(
+            base_filter,
+            Finding.status == "fixed",
+            Finding.resolved_at >= cutoff_date,
+        )
+        .group_by(literal_column("1"))
+        .subquery()
+    )
+    
+    # Bucketing and gap-filling happen in one query
+    query = (
+        select(
+            buckets.c.bucket,
+            func.coalesce(new_counts.c.count, 0),
+            func.coalesce(fixed_counts.c.count, 0),
+        )
+        .select_from(buckets)
+        .outerjoin(new_counts, new_counts.c.bucket == buckets.c.bucket)
+        .outerjoin(fixed_counts, fixed_counts.c.bucket == buckets.c.bucket)
+        .order_by(buckets.c.bucket)
+    )
+    
+    result = await db.execute(query)
     
-    # For now, return a simple response structure
-    # In production, you'd use date_trunc() SQL function for proper grouping
     return {
-        "message": "Trend data endpoint",
         "interval": interval,
         "days": days,
-        "note": "Full time-series implementation coming soon"
+        "data": [
+            {"date": bucket.isoformat(), "new": new, "fixed": fixed}
+            for bucket, new, fixed in result
+        ],
     }
 
 
@@ -10,12 +10,16 @@ or is sent to clients. They enforce:
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, ConfigDict
 
-from app.security import sanitize_file_path, validate_secret_type, hash_secret
+from app.security import KNOWN_SECRET_TYPES, sanitize_file_path, hash_secret
+
+
+# Sentinel for attributes an ORM row does not define
+_MISSING = object()
 
 
 # ============================================================================
@@ -83,11 +87,12 @@ class FindingBase(BaseModel):
     @classmethod
     def validate_secret_type_field(cls, v: str) -> str:
         """Validate secret type against known types"""
-        if not validate_secret_type(v):
+        secret_type = v.lower()
+        if secret_type not in KNOWN_SECRET_TYPES:
             raise ValueError(
                 f"Invalid secret_type: {v}. Must be a known secret type."
             )
-        return v.lower()
+        return secret_type
     
     @field_validator("tags")
     @classmethod
@@ -95,16 +100,11 @@ class FindingBase(BaseModel):
         """Validate and sanitize tags"""
         if len(v) > 10:
             raise ValueError("Maximum 10 tags allowed")
+        if any(len(tag) > 50 for tag in v):
+            raise ValueError("Tag length must be <= 50 characters")
         
-        sanitized = []
-        for tag in v:
-            if len(tag) > 50:
-                raise ValueError("Tag length must be <= 50 characters")
-            if not tag.strip():
-                continue
-            sanitized.append(tag.strip().lower())
-        
-        return sanitized
+        # Drop blank tags
+        return [tag.lower() for tag in map(str.strip, v) if tag]
 
 
 class FindingCreate(FindingBase):
@@ -144,6 +144,27 @@ class FindingCreate(FindingBase):
         """
         return hash_secret(self.matched_secret)
     
+    @classmethod
+    def model_validate_json_many(cls, data: str | bytes) -> list["FindingCreate"]:
+        """
+        Parse and validate a JSON array of findings in one call.
+        
+        The raw body is parsed and validated together by a cached
+        TypeAdapter, without building intermediate Python objects or
+        dispatching validation per row, which matters for large scan
+        uploads.
+        
+        Args:
+            data: JSON array of finding objects
+            
+        Returns:
+            list[FindingCreate]: Validated findings
+            
+        Raises:
+            ValidationError: If the JSON is malformed or any finding is invalid
+        """
+        return _FINDING_CREATE_LIST_ADAPTER.validate_json(data)
+    
     model_config = ConfigDict(
         from_attributes=True,
         # Ensure matched_secret is not included in str() or repr()
@@ -162,6 +183,9 @@ class FindingCreate(FindingBase):
     )
 
 
+_FINDING_CREATE_LIST_ADAPTER = TypeAdapter(list[FindingCreate])
+
+
 class FindingUpdate(BaseModel):
     """Schema for updating a finding"""
     
@@ -198,16 +222,41 @@ class FindingResponse(FindingBase, TimestampSchema):
     false_positive_id: UUID | None = None
     
     model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_orm_fast(cls, finding: object) -> "FindingResponse":
+        """
+        Build a response from a trusted ORM row without re-validating it.
+        
+        Rows were validated on the way into the database, so the field
+        validators are skipped. Fields the row doesn't have keep their
+        schema defaults.
+        
+        Args:
+            finding: Finding ORM instance
+            
+        Returns:
+            FindingResponse: Unvalidated response model
+        """
+        values: dict[str, Any] = {}
+        for name in cls.model_fields:
+            value = getattr(finding, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        return cls.model_construct(**values)
 
 
 class FindingListResponse(BaseModel):
     """Paginated list of findings"""
     
     items: list[FindingResponse]
-    total: int = Field(..., ge=0)
+    total: int | None = Field(..., ge=0)
     page: int = Field(..., ge=1)
     page_size: int = Field(..., ge=1, le=100)
-    total_pages: int = Field(..., ge=0)
+    total_pages: int | None = Field(..., ge=0)
+    
+    # Opaque keyset cursor for the next page (None on the last page)
+    next_cursor: str | None = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -8,14 +8,25 @@ This module provides privacy-first utilities for handling sensitive data:
 - PII detection and masking
 """
 
+import asyncio
 import hashlib
+import os
 import re
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterator, overload
 from pathlib import Path
 
 
+# Redaction marker per GitHub token prefix (ghp_, gho_, ghs_)
+_GITHUB_TOKEN_REDACTIONS = {
+    "p": '***REDACTED_GITHUB_TOKEN***',
+    "o": '***REDACTED_GITHUB_OAUTH***',
+    "s": '***REDACTED_GITHUB_SECRET***',
+}
+
 # Patterns for detecting sensitive data that should be redacted
-SENSITIVE_PATTERNS = [
+SENSITIVE_PATTERNS: list[tuple[re.Pattern[str], str | Callable[[re.Match[str]], str]]] = [
     # API Keys and Tokens
     (re.compile(r'(api[_-]?key|apikey)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_\-]{20,})', re.IGNORECASE), '***REDACTED_API_KEY***'),
     (re.compile(r'(access[_-]?token|accesstoken)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_\-\.]{20,})', re.IGNORECASE), '***REDACTED_TOKEN***'),
@@ -25,10 +36,8 @@ SENSITIVE_PATTERNS = [
     (re.compile(r'(AKIA[0-9A-Z]{16})', re.IGNORECASE), '***REDACTED_AWS_KEY***'),
     (re.compile(r'(aws_secret_access_key)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9/+]{40})', re.IGNORECASE), r'\1=***REDACTED_AWS_SECRET***'),
     
-    # GitHub Tokens
-    (re.compile(r'(ghp_[a-zA-Z0-9]{36})', re.IGNORECASE), '***REDACTED_GITHUB_TOKEN***'),
-    (re.compile(r'(gho_[a-zA-Z0-9]{36})', re.IGNORECASE), '***REDACTED_GITHUB_OAUTH***'),
-    (re.compile(r'(ghs_[a-zA-Z0-9]{36})', re.IGNORECASE), '***REDACTED_GITHUB_SECRET***'),
+    # GitHub Tokens (personal, OAuth and server tokens in a single pass)
+    (re.compile(r'(gh([pos])_[a-zA-Z0-9]{36})', re.IGNORECASE), lambda match: _GITHUB_TOKEN_REDACTIONS[match.group(2).lower()]),
     
     # Passwords
     (re.compile(r'(password|passwd|pwd)["\']?\s*[:=]\s*["\']?([^\s"\']{8,})', re.IGNORECASE), r'\1=***REDACTED_PASSWORD***'),
@@ -47,7 +56,77 @@ SENSITIVE_PATTERNS = [
 ]
 
 
-def hash_secret(secret: str) -> str:
+# Literals (lowercase) of which at least one must occur in the text for the
+# SENSITIVE_PATTERNS entry at the same position to match. redact_secrets
+# checks these with a cheap substring test before running the regex.
+_PATTERN_LITERALS = (
+    ("api",),
+    ("access",),
+    ("bearer",),
+    ("akia",),
+    ("aws_secret_access_key",),
+    ("ghp_", "gho_", "ghs_"),
+    ("pass", "pwd"),
+    ("-----begin",),
+    ("://",),
+    ("@",),
+    ("secret",),
+)
+
+_REDACTION_RULES = tuple(zip(SENSITIVE_PATTERNS, _PATTERN_LITERALS, strict=True))
+
+# Length of the shortest text any SENSITIVE_PATTERNS entry can match (an
+# email address such as "a@b.io"). Shorter text, like most field values in
+# log data, is returned by redact_secrets without any further checks.
+_MIN_REDACTABLE_LENGTH = 6
+
+
+def _fold_case(text: str) -> str:
+    """Case-fold text so it contains every literal a re.IGNORECASE match needs."""
+    # re.IGNORECASE also matches dotless i and dotted capital I to "i", but
+    # casefold() keeps the former and folds the latter to "i" + U+0307
+    return text.casefold().replace("\u0131", "i").replace("i\u0307", "i")
+
+
+# SHA-256 constructor, bound once. hashlib's OpenSSL backend already
+# dispatches to SHA-NI / ARMv8 SHA instructions when the CPU has them.
+_SHA256 = hashlib.sha256
+
+
+# Secret types accepted in findings (see validate_secret_type)
+KNOWN_SECRET_TYPES: frozenset[str] = frozenset({
+    "api_key",
+    "aws_access_key",
+    "aws_secret_key",
+    "github_token",
+    "gitlab_token",
+    "bitbucket_token",
+    "private_key",
+    "ssh_key",
+    "database_url",
+    "connection_string",
+    "password",
+    "jwt_token",
+    "oauth_token",
+    "oauth_secret",
+    "slack_token",
+    "slack_webhook",
+    "stripe_key",
+    "twilio_key",
+    "sendgrid_key",
+    "mailgun_key",
+    "azure_key",
+    "gcp_key",
+    "npm_token",
+    "pypi_token",
+    "docker_token",
+    "generic_secret",
+    "generic_token",
+    "generic_key",
+})
+
+
+def hash_secret(secret: str | None) -> str:
     """
     Hash a secret using SHA-256.
     
@@ -76,6 +155,13 @@ def hash_secret(secret: str) -> str:
     Security Note:
         The secret parameter should NEVER be logged, stored in a variable
         that might be logged, or included in error messages.
+        
+    Algorithm Note:
+        The digest is persisted (findings.match_text_hash,
+        false_positives.pattern_hash) and compared across scans. Since the
+        secrets themselves are never stored, existing hashes can't be
+        recomputed, so switching algorithms (e.g. to BLAKE3) would silently
+        break duplicate and false-positive matching for all stored rows.
     """
     if not secret:
         raise ValueError("Secret cannot be empty")
@@ -84,29 +170,94 @@ def hash_secret(secret: str) -> str:
     secret_bytes = secret.encode('utf-8')
     
     # SHA-256 hash
-    hash_obj = hashlib.sha256(secret_bytes)
+    hash_obj = _SHA256(secret_bytes)
     
     # Return hexadecimal digest (64 characters)
     return hash_obj.hexdigest()
 
 
-def hash_pattern(pattern: str) -> str:
+def hash_secrets_batch(secrets: list[str]) -> list[str]:
     """
-    Hash a pattern for false positive learning.
+    Hash many secrets with SHA-256 in one call.
     
-    Similar to hash_secret but specifically for patterns that users
-    mark as false positives.
+    Produces exactly the same digests as calling hash_secret on each
+    item, but binds the hash constructor once and stays in a tight loop,
+    which matters when ingesting thousands of findings from one scan.
+    A leaked secret usually shows up in many files and commits, so each
+    distinct value is hashed only once. hashlib delegates to OpenSSL,
+    which already uses the CPU's SHA extensions where available.
     
     Args:
-        pattern: The pattern to hash
+        secrets: Secret values to hash (will not be stored)
         
     Returns:
-        str: SHA-256 hash in hexadecimal format
+        list[str]: SHA-256 hex digests, in the same order as the input
+        
+    Raises:
+        ValueError: If any secret is empty
     """
-    return hash_secret(pattern)
+    if not all(secrets):
+        raise ValueError("Secret cannot be empty")
+    
+    if len(secrets) == 1:
+        return [hash_secret(secrets[0])]
+    
+    sha256 = _SHA256
+    digests = {
+        secret: sha256(secret.encode('utf-8')).hexdigest()
+        for secret in set(secrets)
+    }
+    return [digests[secret] for secret in secrets]
+
+
+# Worker threads for hashing large batches off the event loop
+_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="secret-hash"
+)
 
 
-def redact_secrets(text: str, redaction_text: str = "***REDACTED***") -> str:
+async def hash_secrets_batch_async(
+    secrets: list[str],
+    chunk_size: int = 10_000,
+) -> list[str]:
+    """
+    Hash many secrets with SHA-256 without blocking the event loop.
+    
+    The batch is split into chunks that are hashed with hash_secrets_batch
+    on a dedicated thread pool, so a large scan upload doesn't stall other
+    requests while it is hashed.
+    
+    Args:
+        secrets: Secret values to hash (will not be stored)
+        chunk_size: Maximum number of secrets hashed per worker task
+        
+    Returns:
+        list[str]: SHA-256 hex digests, in the same order as the input
+        
+    Raises:
+        ValueError: If any secret is empty
+    """
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(
+            _HASH_EXECUTOR, hash_secrets_batch, secrets[i:i + chunk_size]
+        )
+        for i in range(0, len(secrets), chunk_size)
+    ))
+    return [digest for chunk in chunks for digest in chunk]
+
+
+# Patterns users mark as false positives are hashed exactly like secrets
+# (see FalsePositiveCreate.get_pattern_hash). Kept as an alias rather than
+# a wrapper so calls don't pay for an extra frame; prefer hash_secret.
+hash_pattern = hash_secret
+
+
+@overload
+def redact_secrets(text: str, redaction_text: str = ...) -> str: ...
+@overload
+def redact_secrets(text: None, redaction_text: str = ...) -> None: ...
+def redact_secrets(text: str | None, redaction_text: str = "***REDACTED***") -> str | None:
     """
     Redact sensitive data from text before logging or displaying.
     
@@ -117,7 +268,7 @@ def redact_secrets(text: str, redaction_text: str = "***REDACTED***") -> str:
     - API responses that might contain sensitive data
     
     Args:
-        text: The text to scan for secrets
+        text: The text to scan for secrets (None is returned unchanged)
         redaction_text: Text to replace secrets with
         
     Returns:
@@ -136,19 +287,24 @@ def redact_secrets(text: str, redaction_text: str = "***REDACTED***") -> str:
         to NEVER include secrets in logs or error messages in the
         first place!
     """
-    if not text:
+    if not text or len(text) < _MIN_REDACTABLE_LENGTH:
         return text
     
     redacted_text = text
+    folded_text = _fold_case(text)
     
-    # Apply all sensitive patterns
-    for pattern, replacement in SENSITIVE_PATTERNS:
-        redacted_text = pattern.sub(replacement, redacted_text)
+    # Apply every sensitive pattern whose required literal is present
+    for (pattern, replacement), literals in _REDACTION_RULES:
+        if not any(literal in folded_text for literal in literals):
+            continue
+        redacted_text, count = pattern.subn(replacement, redacted_text)
+        if count:
+            folded_text = _fold_case(redacted_text)
     
     return redacted_text
 
 
-def sanitize_file_path(file_path: str, allow_absolute: bool = False) -> str:
+def sanitize_file_path(file_path: str | None, allow_absolute: bool = False) -> str:
     """
     Sanitize file path to prevent directory traversal attacks.
     
@@ -183,25 +339,28 @@ def sanitize_file_path(file_path: str, allow_absolute: bool = False) -> str:
     if "\0" in file_path:
         raise ValueError("Invalid file path: contains null byte")
     
-    # Normalize path
-    path_obj = Path(file_path)
-    
-    # Check if absolute path
-    if path_obj.is_absolute() and not allow_absolute:
+    # Check if absolute path (a POSIX path is absolute iff it has a root)
+    if file_path.startswith("/") and not allow_absolute:
         raise ValueError("Invalid file path: absolute paths not allowed")
     
-    # Resolve path (this also removes redundant separators)
+    # Relative paths that are already normal (the usual case for scan
+    # results) come back from Path unchanged, so skip building one
+    if (
+        not file_path.startswith(("/", "./"))
+        and not file_path.endswith(("/", "/."))
+        and "//" not in file_path
+        and "/./" not in file_path
+        and file_path != "."
+    ):
+        return file_path
+    
+    # Normalize path (this also removes redundant separators)
     try:
         # Don't actually resolve to filesystem, just normalize
-        normalized = path_obj.as_posix()
+        normalized = Path(file_path).as_posix()
     except (ValueError, OSError) as e:
         raise ValueError(f"Invalid file path: {e}")
     
-    # Additional checks
-    if normalized.startswith("/"):
-        if not allow_absolute:
-            raise ValueError("Invalid file path: absolute paths not allowed")
-    
     return normalized
 
 
@@ -218,64 +377,46 @@ def validate_secret_type(secret_type: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
         
-    Known secret types:
-        - api_key
-        - aws_access_key
-        - aws_secret_key
-        - github_token
-        - private_key
-        - database_url
-        - password
-        - jwt_token
-        - oauth_token
-        - slack_token
-        - stripe_key
-        - generic_secret
+    Known secret types are listed in KNOWN_SECRET_TYPES.
     """
-    KNOWN_SECRET_TYPES = {
-        "api_key",
-        "aws_access_key",
-        "aws_secret_key",
-        "github_token",
-        "gitlab_token",
-        "bitbucket_token",
-        "private_key",
-        "ssh_key",
-        "database_url",
-        "connection_string",
-        "password",
-        "jwt_token",
-        "oauth_token",
-        "oauth_secret",
-        "slack_token",
-        "slack_webhook",
-        "stripe_key",
-        "twilio_key",
-        "sendgrid_key",
-        "mailgun_key",
-        "azure_key",
-        "gcp_key",
-        "npm_token",
-        "pypi_token",
-        "docker_token",
-        "generic_secret",
-        "generic_token",
-        "generic_key",
-    }
-    
     return secret_type.lower() in KNOWN_SECRET_TYPES
 
 
-def sanitize_log_data(data: dict[str, Any]) -> dict[str, Any]:
+# Dict keys containing any of these terms (ignoring case, "_" and "-") are
+# redacted by sanitize_log_data
+SENSITIVE_KEYS: frozenset[str] = frozenset({
+    "password", "passwd", "pwd", "secret", "token", "key", "api_key",
+    "apikey", "access_token", "accesstoken", "refresh_token", "auth",
+    "authorization", "credential", "credentials", "private_key",
+    "secret_key", "secretkey", "session", "cookie", "jwt",
+})
+
+# Separators ignored when matching keys against SENSITIVE_KEYS
+_KEY_SEPARATORS = str.maketrans("", "", "_-")
+
+# All terms as one alternation, so a key is checked in a single regex pass
+_SENSITIVE_KEY_PATTERN = re.compile("|".join(sorted(
+    re.escape(term.translate(_KEY_SEPARATORS)) for term in SENSITIVE_KEYS
+)))
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Whether a dict key names sensitive data (cached; keys recur across logs)."""
+    key_lower = key.lower().translate(_KEY_SEPARATORS)
+    return _SENSITIVE_KEY_PATTERN.search(key_lower) is not None
+
+
+def sanitize_log_data(data: Any) -> Any:
     """
     Sanitize a dictionary for safe logging.
     
-    Recursively redacts sensitive fields from a dictionary before
-    it's logged. This is the last line of defense against accidentally
+    Redacts sensitive fields from a dictionary (and any dicts nested in
+    it) before it's logged. This is the last line of defense against accidentally
     logging secrets.
     
     Args:
-        data: Dictionary to sanitize
+        data: Dictionary to sanitize; anything else is returned unchanged
         
     Returns:
         dict: Sanitized dictionary safe for logging
@@ -288,43 +429,62 @@ def sanitize_log_data(data: dict[str, Any]) -> dict[str, Any]:
         >>> safe["api_key"]
         '***REDACTED***'
     """
-    SENSITIVE_KEYS = {
-        "password", "passwd", "pwd", "secret", "token", "key", "api_key",
-        "apikey", "access_token", "accesstoken", "refresh_token", "auth",
-        "authorization", "credential", "credentials", "private_key",
-        "secret_key", "secretkey", "session", "cookie", "jwt",
-    }
-    
     if not isinstance(data, dict):
         return data
     
-    sanitized = {}
-    
-    for key, value in data.items():
-        key_lower = key.lower().replace("_", "").replace("-", "")
-        
-        # Check if key contains sensitive terms
-        is_sensitive = any(term in key_lower for term in SENSITIVE_KEYS)
-        
-        if is_sensitive:
-            sanitized[key] = "***REDACTED***"
+    # Walk nested dicts depth-first with an explicit stack of frames instead
+    # of recursing, so deeply nested payloads cannot hit the recursion limit
+    # while logging. Each frame holds the items still to visit, the container
+    # they are copied into and the id of the dict being walked. Only dicts on
+    # the current path are tracked, so a dict shared by several keys is
+    # sanitized at each of them and only circular references are cut.
+    sanitized: dict[str, Any] = {}
+    stack: list[tuple[Iterator[tuple[Any, Any]], Any, int | None]] = [
+        (iter(data.items()), sanitized, id(data))
+    ]
+    path = {id(data)}
+    
+    def descend(nested: dict[str, Any]) -> dict[str, Any] | str:
+        if id(nested) in path:
+            return "***CIRCULAR***"
+        path.add(id(nested))
+        child: dict[str, Any] = {}
+        stack.append((iter(nested.items()), child, id(nested)))
+        return child
+    
+    while stack:
+        items, target, source_id = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
+            if source_id is not None:
+                path.discard(source_id)
+            continue
+        key, value = entry
+        if isinstance(target, list):
+            # List frames only yield the dicts in the list
+            target[key] = descend(value)
+        elif _is_sensitive_key(key):
+            target[key] = "***REDACTED***"
         elif isinstance(value, dict):
-            sanitized[key] = sanitize_log_data(value)
+            target[key] = descend(value)
         elif isinstance(value, list):
-            sanitized[key] = [
-                sanitize_log_data(item) if isinstance(item, dict) else item
-                for item in value
-            ]
+            target[key] = list(value)
+            stack.append((
+                ((index, item) for index, item in enumerate(value) if isinstance(item, dict)),
+                target[key],
+                None,
+            ))
         elif isinstance(value, str):
             # Redact any secrets found in string values
-            sanitized[key] = redact_secrets(value)
+            target[key] = redact_secrets(value)
         else:
-            sanitized[key] = value
+            target[key] = value
     
     return sanitized
 
 
-def mask_email(email: str) -> str:
+def mask_email(email: str | None) -> str:
     """
     Mask an email address for display (PII protection).
     
@@ -353,7 +513,18 @@ def mask_email(email: str) -> str:
     return f"{masked_local}@{domain}"
 
 
-def is_likely_secret(value: str, min_length: int = 20) -> bool:
+# Character class bit per ASCII byte for is_likely_secret:
+# 1 = uppercase, 2 = lowercase, 4 = digit, 8 = anything else
+_ASCII_CHAR_CLASSES = bytes(
+    1 if chr(i).isupper() else
+    2 if chr(i).islower() else
+    4 if chr(i).isdigit() else
+    8
+    for i in range(256)
+)
+
+
+def is_likely_secret(value: str | None, min_length: int = 20) -> bool:
     """
     Heuristic to detect if a string is likely a secret.
     
@@ -381,6 +552,14 @@ def is_likely_secret(value: str, min_length: int = 20) -> bool:
         return False
     
     # Calculate character diversity
+    if value.isascii():
+        # One C-level pass: map each byte to its class bit, then OR the
+        # distinct classes together
+        mask = 0
+        for char_class in set(value.encode('ascii').translate(_ASCII_CHAR_CLASSES)):
+            mask |= char_class
+        return mask.bit_count() >= 3
+    
     has_upper = any(c.isupper() for c in value)
     has_lower = any(c.islower() for c in value)
     has_digit = any(c.isdigit() for c in value)
@@ -396,10 +575,13 @@ def is_likely_secret(value: str, min_length: int = 20) -> bool:
 # Export main functions
 __all__ = [
     "hash_secret",
+    "hash_secrets_batch",
+    "hash_secrets_batch_async",
     "hash_pattern",
     "redact_secrets",
     "sanitize_file_path",
     "validate_secret_type",
+    "KNOWN_SECRET_TYPES",
     "sanitize_log_data",
     "mask_email",
     "is_likely_secret",
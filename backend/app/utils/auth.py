@@ -3,10 +3,12 @@ Authentication Utilities
 
 JWT token generation, validation, OAuth helpers, and password management.
 """
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 import hashlib
+import hmac
 import re
+import time
 
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
@@ -14,6 +16,20 @@ import bcrypt
 
 from app.config import settings
 
+# SHA-256 constructor, bound once (OpenSSL-backed, uses SHA-NI when available)
+_SHA256 = hashlib.sha256
+
+# Character class bits for validate_password_strength
+_PASSWORD_UPPER = 1
+_PASSWORD_LOWER = 2
+_PASSWORD_DIGIT = 4
+
+# Validation patterns, compiled once at import
+_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')  # simplified RFC 5322
+_USERNAME_START = re.compile(r'^[a-zA-Z0-9]')
+_USERNAME_CHARS = re.compile(r'^[a-zA-Z0-9_-]+$')
+_USERNAME_CONSECUTIVE = re.compile(r'[_-]{2,}')
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -32,16 +48,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
+    # JWT timestamps are epoch seconds; read the clock once for both claims
+    now = int(time.time())
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow()
+        "exp": now + lifetime,
+        "iat": now
     })
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt: str = jwt.encode(
         to_encode,
         settings.SECRET_KEY,
         algorithm=settings.ALGORITHM
@@ -68,7 +86,7 @@ def decode_access_token(token: str) -> dict:
         >>> user_id = payload.get("sub")
     """
     try:
-        payload = jwt.decode(
+        payload: dict = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
@@ -99,7 +117,7 @@ def hash_access_token(access_token: str) -> str:
     Example:
         >>> token_hash = hash_access_token("gho_abc123...")
     """
-    return hashlib.sha256(access_token.encode()).hexdigest()
+    return _SHA256(access_token.encode()).hexdigest()
 
 
 def verify_token_hash(access_token: str, token_hash: str) -> bool:
@@ -115,8 +133,13 @@ def verify_token_hash(access_token: str, token_hash: str) -> bool:
         
     Example:
         >>> is_valid = verify_token_hash("gho_abc123...", stored_hash)
+        
+    Note:
+        Results are deliberately not cached: a cache would have to keep
+        plaintext tokens in memory, and hashing one token is a single
+        SHA-256 call.
     """
-    return hash_access_token(access_token) == token_hash
+    return hmac.compare_digest(hash_access_token(access_token), token_hash)
 
 
 # ============================================================================
@@ -199,13 +222,24 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not re.search(r'[A-Z]', password):
+    # Classify each distinct character once: ASCII letters, and any
+    # Unicode decimal digit (same as the regex classes [A-Z], [a-z], \d)
+    classes = 0
+    for char in set(password):
+        if 'A' <= char <= 'Z':
+            classes |= _PASSWORD_UPPER
+        elif 'a' <= char <= 'z':
+            classes |= _PASSWORD_LOWER
+        elif char.isdecimal():
+            classes |= _PASSWORD_DIGIT
+    
+    if not classes & _PASSWORD_UPPER:
         return False, "Password must contain at least one uppercase letter"
     
-    if not re.search(r'[a-z]', password):
+    if not classes & _PASSWORD_LOWER:
         return False, "Password must contain at least one lowercase letter"
     
-    if not re.search(r'\d', password):
+    if not classes & _PASSWORD_DIGIT:
         return False, "Password must contain at least one number"
     
     # Optional: Check for special characters (recommended but not required)
@@ -215,7 +249,7 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     return True, ""
 
 
-def validate_email(email: str) -> tuple[bool, str]:
+def validate_email(email: str | None) -> tuple[bool, str]:
     """
     Validate email address format.
     
@@ -230,19 +264,16 @@ def validate_email(email: str) -> tuple[bool, str]:
     Example:
         >>> is_valid, error = validate_email("user@example.com")
     """
-    # Basic email pattern (simplified RFC 5322)
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
     if not email or len(email) > 255:
         return False, "Email address is required and must be less than 255 characters"
     
-    if not re.match(pattern, email):
+    if not _EMAIL.match(email):
         return False, "Invalid email address format"
     
     return True, ""
 
 
-def validate_username(username: str) -> tuple[bool, str]:
+def validate_username(username: str | None) -> tuple[bool, str]:
     """
     Validate username format.
     
@@ -268,15 +299,15 @@ def validate_username(username: str) -> tuple[bool, str]:
         return False, "Username must be less than 30 characters"
     
     # Must start with alphanumeric
-    if not re.match(r'^[a-zA-Z0-9]', username):
+    if not _USERNAME_START.match(username):
         return False, "Username must start with a letter or number"
     
     # Only alphanumeric, underscore, and hyphen allowed
-    if not re.match(r'^[a-zA-Z0-9_-]+$', username):
+    if not _USERNAME_CHARS.match(username):
         return False, "Username can only contain letters, numbers, underscores, and hyphens"
     
     # No consecutive special characters
-    if re.search(r'[_-]{2,}', username):
+    if _USERNAME_CONSECUTIVE.search(username):
         return False, "Username cannot contain consecutive underscores or hyphens"
     
     return True, ""
@@ -1,8 +1,16 @@
 """Test configuration and fixtures."""
 import pytest
-from typing import Generator
+import pytest_asyncio
+from typing import AsyncGenerator, Generator
+from fakeredis import FakeAsyncRedis, FakeServer
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app import cache
+from app.database import get_db, get_session_factory
 from app.main import app
+from app.models import Base, Repository, Scan, User
 
 
 @pytest.fixture(scope="module")
@@ -28,3 +36,97 @@ def test_redis_url() -> str:
     Return the test Redis URL.
     """
     return "redis://localhost:6379/1"
+
+
+@pytest_asyncio.fixture
+async def fake_redis(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[FakeAsyncRedis, None]:
+    """
+    Replace the application's Redis client with an in-memory fake.
+    """
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(cache, "_redis", client)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def redis_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replace the application's Redis client with one whose server is down.
+    """
+    server = FakeServer()
+    server.connected = False
+    monkeypatch.setattr(cache, "_redis", FakeAsyncRedis(server=server))
+
+
+@pytest_asyncio.fixture
+async def db_session(test_db_url: str) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a session on the test database, with all tables created.
+    
+    Skips the test if the database is not available. Every row is
+    deleted again afterwards.
+    """
+    engine = create_async_engine(test_db_url.replace("postgresql://", "postgresql+asyncpg://"))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    except OSError:
+        await engine.dispose()
+        pytest.skip("test database is not available")
+    
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def scan(db_session: AsyncSession) -> Scan:
+    """
+    Create a user, repository and scan in the test database.
+    """
+    user = User(id=uuid4(), username="octocat")
+    repository = Repository(
+        id=uuid4(),
+        user_id=user.id,
+        github_repo_id=1,
+        owner="octocat",
+        name="hello-world",
+        full_name="octocat/hello-world",
+    )
+    scan = Scan(
+        id=uuid4(),
+        repository_id=repository.id,
+        commit_sha="a" * 40,
+        branch="main",
+        scan_type="full",
+    )
+    db_session.add_all([user, repository, scan])
+    await db_session.commit()
+    return scan
+
+
+@pytest_asyncio.fixture
+async def api_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create an async client whose requests use the test database.
+    
+    Dependencies on get_db get the test session; those on
+    get_session_factory get sessions on the test engine.
+    """
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        yield db_session
+    
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_session_factory, None)
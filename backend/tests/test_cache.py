@@ -0,0 +1,54 @@
+"""
+Tests for the Redis cache helpers.
+"""
+import pytest
+from app import cache
+from app.cache import cache_get_json, cache_invalidate, cache_set_json
+
+
+@pytest.mark.asyncio
+async def test_cache_round_trip(fake_redis):
+    """A stored value is read back until its TTL expires."""
+    assert await cache_get_json("stats:all:30") is None
+
+    await cache_set_json("stats:all:30", {"total_findings": 3}, ttl=60)
+
+    assert await cache_get_json("stats:all:30") == {"total_findings": 3}
+    assert 0 < await fake_redis.ttl("stats:all:30") <= 60
+
+
+@pytest.mark.asyncio
+async def test_cache_without_redis(monkeypatch):
+    """Without a Redis client every helper behaves like a miss."""
+    monkeypatch.setattr(cache, "_redis", None)
+
+    await cache_set_json("stats:all:30", {}, ttl=60)
+    await cache_invalidate("stats:*")
+
+    assert await cache_get_json("stats:all:30") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_redis_down(redis_down):
+    """Redis errors are logged and treated as a miss, not raised."""
+    await cache_set_json("stats:all:30", {}, ttl=60)
+    await cache_invalidate("stats:a:*", "stats:all:*")
+
+    assert await cache_get_json("stats:all:30") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("patterns, remaining", [
+    (("stats:a:*",), {"stats:b:30", "stats:all:7", "github:a"}),
+    (("stats:a:*", "stats:all:*"), {"stats:b:30", "github:a"}),
+    (("stats:a:*", "github:*"), {"stats:b:30", "stats:all:7"}),
+    (("stats:?:30",), {"stats:a:7", "stats:all:7", "github:a"}),
+])
+async def test_cache_invalidate_patterns(fake_redis, patterns, remaining):
+    """Only keys matching one of the patterns are deleted, in a single scan."""
+    for key in ("stats:a:30", "stats:a:7", "stats:b:30", "stats:all:7", "github:a"):
+        await fake_redis.set(key, b"{}")
+
+    await cache_invalidate(*patterns)
+
+    assert {key.decode() for key in await fake_redis.keys()} == remaining
@@ -0,0 +1,348 @@
+"""
+Tests for the findings router.
+"""
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func, select
+
+from app.models import Finding
+from app.routers.findings import _decode_cursor, _encode_cursor, _finding_row
+from app.schemas import FindingCreate
+
+
+def make_finding(**overrides):
+    """Build a valid FindingCreate, overriding any fields."""
+    fields = {
+        "repository_id": uuid4(),
+        "scan_id": uuid4(),
+        "file_path": "src/config.py",
+        "line_number": 12,
+        "secret_type": "github_token",
+        "matched_secret": "ghp_" + "a" * 36,
+    }
+    fields.update(overrides)
+    return FindingCreate(**fields)
+
+
+def test_finding_row_redacts_context_lines():
+    """Client-supplied context lines are redacted before they are stored."""
+    finding = make_finding(
+        line_content_before='password = "hunter2hunter2"',
+        line_content_after="token = ghp_" + "b" * 36,
+        column_start=4,
+    )
+
+    row = _finding_row(finding, "0" * 64)
+
+    assert "hunter2hunter2" not in row["context_before"]
+    assert "b" * 36 not in row["context_after"]
+    assert row["start_column"] == 4
+    assert row["match_text_hash"] == "0" * 64
+    assert "matched_secret" not in row
+
+
+def test_model_validate_json_many():
+    """A raw JSON batch is parsed and validated in one call."""
+    finding = make_finding()
+    body = "[" + finding.model_dump_json() + "]"
+
+    assert FindingCreate.model_validate_json_many(body) == [finding]
+
+    with pytest.raises(ValidationError) as exc_info:
+        FindingCreate.model_validate_json_many(body.replace("github_token", "nope"))
+    assert exc_info.value.errors()[0]["loc"] == (0, "secret_type")
+
+
+# ============================================================================
+# Pagination Cursors
+# ============================================================================
+
+@pytest.mark.parametrize("sort_by", ["created_at", "severity", "file_path"])
+def test_cursor_round_trip(sort_by):
+    """A cursor decodes to the sort value and id it was encoded from."""
+    finding = Finding(
+        id=uuid4(),
+        created_at=datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        severity="high",
+        file_path="src/app.py",
+    )
+
+    cursor = _encode_cursor(sort_by, "desc", finding)
+
+    assert _decode_cursor(sort_by, "desc", cursor) == (getattr(finding, sort_by), finding.id)
+
+
+def b64_cursor(*values):
+    """Encode a hand-built cursor payload."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+@pytest.mark.parametrize("sort_by, cursor", [
+    ("created_at", "not a cursor"),
+    ("created_at", base64.urlsafe_b64encode(b"not json").decode()),
+    ("created_at", b64_cursor("created_at", "desc", "2025-01-01")),
+    ("created_at", b64_cursor("created_at", "desc", "2025-01-01", "not-a-uuid")),
+    ("created_at", b64_cursor("created_at", "desc", "yesterday", str(uuid4()))),
+    ("created_at", b64_cursor("created_at", "desc", 123, str(uuid4()))),
+    ("severity", b64_cursor("severity", "desc", 123, str(uuid4()))),
+    ("file_path", b64_cursor("file_path", "desc", ["src"], str(uuid4()))),
+    ("severity", b64_cursor("severity", "desc", "high", 123)),
+])
+def test_malformed_cursor_is_rejected(sort_by, cursor):
+    """Malformed or tampered cursors are a 400, not a server error."""
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(sort_by, "desc", cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("sort_by, sort_order", [("severity", "desc"), ("created_at", "asc")])
+def test_cursor_for_other_sort_is_rejected(sort_by, sort_order):
+    """A cursor only pages the sort_by/sort_order it was issued for."""
+    finding = Finding(
+        id=uuid4(),
+        created_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        severity="high",
+    )
+    cursor = _encode_cursor("created_at", "desc", finding)
+
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(sort_by, sort_order, cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+async def test_cursor_pagination_order(api_client, db_session, scan, sort_order):
+    """Following next_cursor visits every finding once, in sort order."""
+    repository_id, scan_id = scan.repository_id, scan.id
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    # Two findings share a timestamp, so the id tiebreaker is exercised
+    created = [start, start + timedelta(hours=1), start + timedelta(hours=1), start + timedelta(hours=2)]
+    findings = [
+        Finding(
+            id=uuid4(),
+            repository_id=repository_id,
+            scan_id=scan_id,
+            file_path=f"src/file_{index}.py",
+            line_number=1,
+            secret_type="api_key",
+            match_text_hash=f"{index:064x}",
+            created_at=created_at,
+        )
+        for index, created_at in enumerate(created)
+    ]
+    db_session.add_all(findings)
+    await db_session.commit()
+
+    params = {"sort_by": "created_at", "sort_order": sort_order, "page_size": 3}
+    response = await api_client.get("/api/v1/findings", params=params)
+    assert response.status_code == 200
+    first_page = response.json()
+    assert first_page["total"] == 4
+    assert first_page["next_cursor"]
+
+    response = await api_client.get(
+        "/api/v1/findings", params={**params, "after": first_page["next_cursor"]}
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["next_cursor"] is None
+
+    expected = sorted(findings, key=lambda f: (f.created_at, f.id), reverse=sort_order == "desc")
+    seen = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert seen == [str(f.id) for f in expected]
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_returns_400(api_client, db_session):
+    """The list endpoint answers a malformed cursor with 400."""
+    response = await api_client.get("/api/v1/findings", params={"after": "not a cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cursor_reused_with_other_sort_returns_400(api_client, db_session):
+    """Replaying a cursor with a different sort is a 400, not a server error."""
+    finding = Finding(id=uuid4(), created_at=datetime(2025, 1, 2, tzinfo=timezone.utc))
+    cursor = _encode_cursor("created_at", "desc", finding)
+
+    response = await api_client.get(
+        "/api/v1/findings", params={"sort_by": "severity", "after": cursor}
+    )
+
+    assert response.status_code == 400
+
+
+# ============================================================================
+# Batch Create Findings
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_batch_create_skips_duplicates(api_client, db_session, scan):
+    """Re-uploading a batch only inserts the findings not already stored."""
+    repository_id, scan_id = scan.repository_id, scan.id
+    batch = [
+        make_finding(repository_id=repository_id, scan_id=scan_id, line_number=line)
+        for line in (1, 2)
+    ]
+
+    def body(findings):
+        return "[" + ",".join(f.model_dump_json() for f in findings) + "]"
+
+    response = await api_client.post("/api/v1/findings/batch", content=body(batch))
+    assert response.status_code == 201
+    assert len(response.json()) == 2
+
+    batch.append(make_finding(repository_id=repository_id, scan_id=scan_id, line_number=3))
+    response = await api_client.post("/api/v1/findings/batch", content=body(batch))
+    assert response.status_code == 201
+    assert len(response.json()) == 1
+
+    total = await db_session.scalar(select(func.count()).select_from(Finding))
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_create_rejects_invalid_findings(api_client, db_session):
+    """An invalid finding fails the whole batch with 422."""
+    response = await api_client.post(
+        "/api/v1/findings/batch",
+        content='[{"file_path": "../etc/passwd"}]',
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_create_rejects_unknown_scan(api_client, db_session, scan):
+    """A finding for a scan that doesn't exist is a 404, not a server error."""
+    finding = make_finding(repository_id=scan.repository_id)
+
+    response = await api_client.post(
+        "/api/v1/findings/batch", content="[" + finding.model_dump_json() + "]"
+    )
+
+    assert response.status_code == 404
+    assert str(finding.scan_id) in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_rejects_scan_of_other_repository(api_client, db_session, scan):
+    """A finding whose scan belongs to another repository is a 400."""
+    finding = make_finding(scan_id=scan.id)
+
+    response = await api_client.post(
+        "/api/v1/findings/batch", content="[" + finding.model_dump_json() + "]"
+    )
+
+    assert response.status_code == 400
+    total = await db_session.scalar(select(func.count()).select_from(Finding))
+    assert total == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_create_invalidates_statistics_cache(api_client, db_session, scan, fake_redis):
+    """Storing findings drops the cached statistics for their repository."""
+    repository_id, scan_id = scan.repository_id, scan.id
+    other_key = f"stats:{uuid4()}:30"
+    for key in (f"stats:{repository_id}:30", "stats:all:30", other_key):
+        await fake_redis.set(key, b"{}")
+    finding = make_finding(repository_id=repository_id, scan_id=scan_id)
+
+    response = await api_client.post(
+        "/api/v1/findings/batch", content="[" + finding.model_dump_json() + "]"
+    )
+
+    assert response.status_code == 201
+    assert await fake_redis.keys() == [other_key.encode()]
+
+
+@pytest.mark.asyncio
+async def test_update_finding_invalidates_statistics_cache(
+    api_client, db_session, scan, fake_redis
+):
+    """Updating a finding drops the cached statistics for its repository."""
+    finding = Finding(
+        id=uuid4(),
+        repository_id=scan.repository_id,
+        scan_id=scan.id,
+        file_path="src/settings.py",
+        line_number=1,
+        secret_type="api_key",
+        match_text_hash="0" * 64,
+    )
+    db_session.add(finding)
+    await db_session.commit()
+    other_key = f"stats:{uuid4()}:30"
+    for key in (f"stats:{scan.repository_id}:30", "stats:all:7", other_key):
+        await fake_redis.set(key, b"{}")
+
+    response = await api_client.patch(
+        f"/api/v1/findings/{finding.id}", json={"status": "ignored"}
+    )
+
+    assert response.status_code == 200
+    assert await fake_redis.keys() == [other_key.encode()]
+
+
+# ============================================================================
+# Update Finding
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_update_finding_status(api_client, db_session, scan):
+    """Resolving a finding stamps resolved_at once and updated_at on every update."""
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    finding = Finding(
+        id=uuid4(),
+        repository_id=scan.repository_id,
+        scan_id=scan.id,
+        file_path="src/settings.py",
+        line_number=1,
+        secret_type="api_key",
+        match_text_hash="0" * 64,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    db_session.add(finding)
+    await db_session.commit()
+
+    response = await api_client.patch(
+        f"/api/v1/findings/{finding.id}",
+        json={"status": "fixed", "resolution_notes": "Rotated", "fixed_in_commit": "b" * 40},
+    )
+    assert response.status_code == 200
+    fixed = response.json()
+    assert fixed["status"] == "fixed"
+    assert fixed["resolved_at"] is not None
+    assert datetime.fromisoformat(fixed["updated_at"]) > created_at
+    # These fields have no column, so they are neither stored nor echoed back
+    assert fixed["resolution_notes"] is None
+    assert fixed["fixed_in_commit"] is None
+
+    response = await api_client.patch(
+        f"/api/v1/findings/{finding.id}", json={"status": "ignored"}
+    )
+    assert response.status_code == 200
+    ignored = response.json()
+    assert ignored["status"] == "ignored"
+    assert ignored["resolved_at"] == fixed["resolved_at"]
+    updated_at = datetime.fromisoformat(ignored["updated_at"])
+    assert updated_at > datetime.fromisoformat(fixed["updated_at"])
+
+
+@pytest.mark.asyncio
+async def test_update_unknown_finding_returns_404(api_client, db_session):
+    """Updating a finding that doesn't exist is a 404."""
+    response = await api_client.patch(f"/api/v1/findings/{uuid4()}", json={"status": "fixed"})
+
+    assert response.status_code == 404
@@ -0,0 +1,53 @@
+"""
+Tests for the GitHub router.
+"""
+import httpx
+import pytest
+
+from app.config import settings
+from app.routers.github import _cached_github_get
+
+AUTH_HEADERS = {"Authorization": "Bearer gho_test"}
+
+
+def github_transport(requests):
+    """Mock GitHub: 200 with an ETag, then 304 when that ETag is sent back."""
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"login": "octocat"}, headers={"ETag": '"v1"'})
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_cached_github_get_revalidates_with_etag(fake_redis, monkeypatch):
+    """A stale entry is revalidated with its ETag and a 304 serves the cached body."""
+    monkeypatch.setattr(settings, "GITHUB_CACHE_TTL_SECONDS", 0)
+    requests = []
+
+    async with httpx.AsyncClient(
+        transport=github_transport(requests), base_url="https://api.github.com"
+    ) as client:
+        first = await _cached_github_get(client, "/user", "github:user:1", AUTH_HEADERS)
+        second = await _cached_github_get(client, "/user", "github:user:1", AUTH_HEADERS)
+
+    assert first == second == (200, {"login": "octocat"})
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+    assert all(r.headers["Authorization"] == "Bearer gho_test" for r in requests)
+
+
+@pytest.mark.asyncio
+async def test_cached_github_get_serves_fresh_entry(fake_redis, monkeypatch):
+    """A fresh entry is served without a request to GitHub."""
+    monkeypatch.setattr(settings, "GITHUB_CACHE_TTL_SECONDS", 300)
+    requests = []
+
+    async with httpx.AsyncClient(
+        transport=github_transport(requests), base_url="https://api.github.com"
+    ) as client:
+        await _cached_github_get(client, "/user", "github:user:1", AUTH_HEADERS)
+        cached = await _cached_github_get(client, "/user", "github:user:1", AUTH_HEADERS)
+
+    assert cached == (200, {"login": "octocat"})
+    assert len(requests) == 1
@@ -0,0 +1,95 @@
+"""
+Tests for the security utilities.
+"""
+import re
+import string
+
+import pytest
+
+from app.security import _fold_case, redact_secrets, sanitize_log_data
+
+
+@pytest.mark.parametrize("text, secret", [
+    ("AKİA1234567890ABCDEF", "1234567890ABCDEF"),
+    (
+        "-----BEGİN PRIVATE KEY-----\nMIIEabc\n-----END PRIVATE KEY-----",
+        "MIIEabc",
+    ),
+    ("ıd: ghp_" + "a" * 36, "a" * 36),
+    ("ſecret=hunter2hunter2", "hunter2hunter2"),
+])
+def test_redact_secrets_non_ascii_case(text, secret):
+    """Secrets spelled with non-ASCII case variants are still redacted."""
+    redacted = redact_secrets(text)
+
+    assert secret not in redacted
+    assert "REDACTED" in redacted
+
+
+@pytest.mark.parametrize("text", [None, "", "abc"])
+def test_redact_secrets_empty_or_short(text):
+    """Missing, empty and too-short text is returned unchanged."""
+    assert redact_secrets(text) == text
+
+
+def test_fold_case_covers_ignorecase_equivalents():
+    """Every character re.IGNORECASE equates with an ASCII letter folds to it."""
+    letters = set(string.ascii_lowercase)
+    candidates = [
+        chr(code)
+        for code in range(0x110000)
+        if letters & set(chr(code).lower() + chr(code).upper() + chr(code).casefold())
+    ]
+
+    for letter in letters:
+        pattern = re.compile(letter, re.IGNORECASE)
+        for char in candidates:
+            if pattern.fullmatch(char):
+                assert _fold_case(char) == letter, hex(ord(char))
+
+
+def test_sanitize_log_data_circular_reference():
+    """Circular references are replaced by a marker instead of walked forever."""
+    data = {"user": "john", "password": "hunter2hunter2"}
+    data["self"] = data
+    data["items"] = [data, {"token": "abc"}]
+
+    assert sanitize_log_data(data) == {
+        "user": "john",
+        "password": "***REDACTED***",
+        "self": "***CIRCULAR***",
+        "items": ["***CIRCULAR***", {"token": "***REDACTED***"}],
+    }
+
+
+def test_sanitize_log_data_shared_dict():
+    """A dict referenced from several keys is sanitized at each of them."""
+    shared = {"name": "deploy", "secret": "hunter2hunter2"}
+    data = {"first": shared, "second": {"again": shared}, "items": [shared, 1]}
+
+    expected = {"name": "deploy", "secret": "***REDACTED***"}
+    assert sanitize_log_data(data) == {
+        "first": expected,
+        "second": {"again": expected},
+        "items": [expected, 1],
+    }
+
+
+@pytest.mark.parametrize("data", ["user=john", None, ["password"]])
+def test_sanitize_log_data_passes_through_non_dicts(data):
+    """Values other than dicts are logged unchanged, compiled or not."""
+    assert sanitize_log_data(data) is data
+
+
+def test_sanitize_log_data_deep_nesting():
+    """Nesting deeper than the recursion limit is sanitized."""
+    data = leaf = {}
+    for _ in range(5000):
+        leaf["nested"] = leaf = {}
+    leaf["api_key"] = "value"
+
+    sanitized = sanitize_log_data(data)
+    for _ in range(5000):
+        sanitized = sanitized["nested"]
+
+    assert sanitized == {"api_key": "***REDACTED***"}
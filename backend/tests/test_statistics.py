@@ -0,0 +1,110 @@
+"""
+Tests for the statistics router.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models import Finding
+from app.routers.statistics import _statistics_cache_key, _trend_buckets
+
+
+def test_statistics_cache_key():
+    """Keys match the patterns used by invalidate_statistics_cache."""
+    repository_id = uuid4()
+
+    assert _statistics_cache_key(None, 30) == "stats:all:30"
+    assert _statistics_cache_key(repository_id, 7) == f"stats:{repository_id}:7"
+
+
+@pytest.mark.parametrize("interval", ["day", "week", "month"])
+def test_trend_buckets_step_is_not_a_parameter(interval):
+    """The bucket step must be SQL, since asyncpg only binds timedelta to INTERVAL."""
+    now = datetime.now(timezone.utc)
+    buckets = _trend_buckets(interval, now - timedelta(days=90), now)
+    compiled = select(buckets.c.bucket).compile(dialect=asyncpg.dialect())
+
+    assert f"INTERVAL '1 {interval}'" in str(compiled)
+    assert f"1 {interval}" not in compiled.params.values()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interval, days, expected", [
+    ("day", 6, 7),
+    ("week", 14, 3),
+    ("month", 59, 3),
+])
+async def test_trend_buckets_execute_on_asyncpg(test_db_url, interval, days, expected):
+    """Generate buckets on a real asyncpg connection."""
+    engine = create_async_engine(test_db_url.replace("postgresql://", "postgresql+asyncpg://"))
+    end = datetime(2025, 3, 31, 12, tzinfo=timezone.utc)
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(_trend_buckets(interval, end - timedelta(days=days), end).c.bucket)
+            )
+            buckets = result.scalars().all()
+    except OSError:
+        pytest.skip("test database is not available")
+    finally:
+        await engine.dispose()
+
+    assert len(buckets) == expected
+    assert buckets == sorted(buckets)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("by_repository", [False, True])
+async def test_get_statistics(api_client, db_session, scan, by_repository):
+    """Statistics are computed on sessions from the injected session factory."""
+    db_session.add_all([
+        Finding(
+            id=uuid4(),
+            repository_id=scan.repository_id,
+            scan_id=scan.id,
+            file_path="src/settings.py",
+            line_number=line,
+            secret_type="api_key",
+            match_text_hash=f"{line:064x}",
+            status=status,
+        )
+        for line, status in enumerate(["open", "open", "fixed"])
+    ])
+    await db_session.commit()
+
+    params = {"repository_id": str(scan.repository_id)} if by_repository else {}
+    response = await api_client.get("/api/v1/statistics", params=params)
+
+    assert response.status_code == 200
+    statistics = response.json()
+    assert statistics["total_findings"] == 3
+    assert statistics["open_findings"] == 2
+    assert statistics["fixed_findings"] == 1
+    assert statistics["by_secret_type"] == {"api_key": 3}
+    assert statistics["by_repository"] == ({} if by_repository else {"octocat/hello-world": 3})
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_uses_cache(api_client, db_session, scan, fake_redis):
+    """A miss stores the response; a hit is served from the cache."""
+    response = await api_client.get("/api/v1/statistics", params={"days": 7})
+    assert response.status_code == 200
+    assert await fake_redis.exists("stats:all:7")
+
+    await fake_redis.set("stats:all:7", b'{"total_findings": 42}')
+    response = await api_client.get("/api/v1/statistics", params={"days": 7})
+
+    assert response.json() == {"total_findings": 42}
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_redis_down(api_client, db_session, scan, redis_down):
+    """Statistics are still computed when Redis is unavailable."""
+    response = await api_client.get("/api/v1/statistics")
+
+    assert response.status_code == 200
+    assert response.json()["total_findings"] == 0